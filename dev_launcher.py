@@ -7,6 +7,7 @@ import subprocess
 import winreg
 import argparse
 import traceback
+from concurrent.futures import ThreadPoolExecutor
 
 """
 Dev Launcher for Insta Outreach Logger
@@ -29,8 +30,50 @@ PROJECT_ROOT = os.path.dirname(os.path.abspath(__file__))
 def log(msg, level="INFO"):
     print(f"[{level}] {msg}")
 
+def _needs_copy(src, dst):
+    """True if dst is missing or differs from src in size or mtime."""
+    try:
+        dst_stat = os.stat(dst)
+    except FileNotFoundError:
+        return True
+    src_stat = os.stat(src)
+    return (src_stat.st_size != dst_stat.st_size
+            or src_stat.st_mtime_ns != dst_stat.st_mtime_ns)
+
+def sync_tree(source_dir, target_dir, max_workers=16):
+    """
+    Incrementally mirror source_dir into target_dir (rsync-style).
+    Only new or changed files are copied (threaded); files and folders that no
+    longer exist in the source are removed. Returns the number of files copied.
+    """
+    pairs = []
+    for root, dirs, files in os.walk(source_dir):
+        dest_root = os.path.join(target_dir, os.path.relpath(root, source_dir))
+        os.makedirs(dest_root, exist_ok=True)
+        for name in files:
+            src = os.path.join(root, name)
+            dst = os.path.join(dest_root, name)
+            if _needs_copy(src, dst):
+                pairs.append((src, dst))
+
+    # Prune stale entries bottom-up so emptied folders can be removed too
+    for root, dirs, files in os.walk(target_dir, topdown=False):
+        src_root = os.path.join(source_dir, os.path.relpath(root, target_dir))
+        for name in files:
+            if not os.path.exists(os.path.join(src_root, name)):
+                os.remove(os.path.join(root, name))
+        for name in dirs:
+            if not os.path.isdir(os.path.join(src_root, name)):
+                shutil.rmtree(os.path.join(root, name), ignore_errors=True)
+
+    if pairs:
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            # list() re-raises the first copy error, if any
+            list(executor.map(lambda p: shutil.copy2(*p), pairs))
+    return len(pairs)
+
 def deploy_extension():
-    """Copy extension files to Documents, preserving source."""
+    """Sync extension files to Documents, preserving source."""
     log(f"Deploying extension to: {EXT_TARGET_DIR}")
     
     # 1. Find Source
@@ -44,21 +87,13 @@ def deploy_extension():
         log(f"Extension source not found at {source_path}", "ERROR")
         return False
 
-    # 2. Clear Target
-    if os.path.exists(EXT_TARGET_DIR):
-        try:
-            shutil.rmtree(EXT_TARGET_DIR)
-        except Exception as e:
-            log(f"Failed to clear target dir: {e}. Chrome might be locking files.", "ERROR")
-            return False
-
-    # 3. Copy (Preserve Source)
+    # 2. Incremental sync (unchanged files are left alone, so Chrome's handles stay valid)
     try:
-        shutil.copytree(source_path, EXT_TARGET_DIR)
-        log("Extension files deployed successfully.")
+        copied = sync_tree(source_path, EXT_TARGET_DIR)
+        log(f"Extension files deployed successfully ({copied} updated).")
         return True
     except Exception as e:
-        log(f"Copy failed: {e}", "ERROR")
+        log(f"Sync failed: {e}. Chrome might be locking files.", "ERROR")
         return False
 
 def register_native_host():
@@ -83,25 +118,32 @@ def register_native_host():
                     "chrome-extension://clbpjppnmamfdkglgkhdldofpcfljilc/" 
                 ]
             }
+            manifest_changed = True
         else:
             # Update Manifest Path
             with open(manifest_src, 'r') as f:
                 data = json.load(f)
-        
-        data['path'] = bridge_bat
+            manifest_changed = data.get('path') != bridge_bat
         
         # Write back to source (or should we write to documents??)
         # For dev mode, writing to source is fine as it keeps it in sync.
         # But `launcher.py` might try to overwrite it.
         # Let's ensure the Registry points to THIS manifest.
-
-        with open(manifest_src, 'w') as f:
-            json.dump(data, f, indent=4)
+        # Only touch the file when the path actually changed.
+        if manifest_changed:
+            data['path'] = bridge_bat
+            with open(manifest_src, 'w') as f:
+                json.dump(data, f, indent=4)
         
-        # Registry
+        # Registry (skip the write if it already points here)
         key_path = r"Software\Google\Chrome\NativeMessagingHosts\com.instaoutreach.logger"
         key = winreg.CreateKey(winreg.HKEY_CURRENT_USER, key_path)
-        winreg.SetValueEx(key, "", 0, winreg.REG_SZ, manifest_src)
+        try:
+            current_value, _ = winreg.QueryValueEx(key, "")
+        except FileNotFoundError:
+            current_value = None
+        if current_value != manifest_src:
+            winreg.SetValueEx(key, "", 0, winreg.REG_SZ, manifest_src)
         winreg.CloseKey(key)
         
         log(f"Success: Registry set to {manifest_src}")
@@ -116,6 +158,8 @@ def cleanup_environment():
     files_to_remove = [
         "operator_config.json",
         "update_config.json",
+        "update_cache.json",
+        "native_host_state.json",
         "user_preferences.json"
     ]
     
@@ -155,7 +199,8 @@ def main():
     # 3. Launch
     print("\nStarting Launcher...")
     cmd = [sys.executable, "launcher.py", "--skip-update"]
-    subprocess.run(cmd)
+    # Forward the launcher's exit code to the calling shell
+    sys.exit(subprocess.call(cmd))
 
 if __name__ == "__main__":
     main()
@@ -22,11 +22,10 @@ import datetime
 import traceback
 import shutil
 import subprocess
-import urllib.request
-import urllib.error
 import tempfile
-import argparse
 import re
+import signal
+import threading
 
 # Import version info and LOG_DIR early
 try:
@@ -48,6 +47,9 @@ else:
     CRASH_LOG_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'crash_log.txt')
 
 
+CRASH_LOG_MAX_BYTES = 1_000_000  # Rotate to crash_log.txt.1 beyond this
+
+
 def log_crash(error_msg, exc_info=None):
     """Write crash information to a log file."""
     # Always print to console first for immediate visibility
@@ -61,18 +63,31 @@ def log_crash(error_msg, exc_info=None):
             if not os.path.exists(log_dir):
                 os.makedirs(log_dir, exist_ok=True)
 
+        # Keep the log bounded under a crash loop (one previous generation kept)
+        try:
+            if os.path.getsize(CRASH_LOG_PATH) > CRASH_LOG_MAX_BYTES:
+                os.replace(CRASH_LOG_PATH, CRASH_LOG_PATH + '.1')
+        except OSError:
+            pass
+
+        lines = [
+            f"\n{'='*60}",
+            f"CRASH LOG - {datetime.datetime.now().isoformat()}",
+            f"{'='*60}",
+            f"Error: {error_msg}",
+        ]
+        if exc_info:
+            lines.append(f"\nTraceback:\n{traceback.format_exc().rstrip()}")
+        lines += [
+            f"\nPython: {sys.version}",
+            f"Frozen: {getattr(sys, 'frozen', False)}",
+            f"Executable: {sys.executable}",
+            "",
+        ]
+
+        # Single write per entry
         with open(CRASH_LOG_PATH, 'a', encoding='utf-8') as f:
-            f.write(f"\n{'='*60}\n")
-            f.write(f"CRASH LOG - {datetime.datetime.now().isoformat()}\n")
-            f.write(f"{'='*60}\n")
-            f.write(f"Error: {error_msg}\n")
-            if exc_info:
-                f.write(f"\nTraceback:\n")
-                f.write(traceback.format_exc())
-            f.write(f"\nPython: {sys.version}\n")
-            f.write(f"Frozen: {getattr(sys, 'frozen', False)}\n")
-            f.write(f"Executable: {sys.executable}\n")
-            f.write(f"\n")
+            f.write('\n'.join(lines) + '\n')
     except Exception as e:
         print(f"Could not write crash log: {e}")
 
@@ -104,6 +119,27 @@ def show_warning_message(title, message):
         # Fallback to console if GUI fails
         print(f"\n[WARNING] {title}: {message}")
 
+# Heavy third-party modules the main UI pulls in. Importing them on a background
+# thread while the launcher is otherwise waiting (update prompt, unlocking the
+# Setup Pack) leaves them in sys.modules for AppUI. Our own src.* modules are
+# deliberately not listed: src.core.database reads credentials at import time,
+# so it must only be imported after SecretsManager has loaded them.
+_PREWARM_MODULES = ('customtkinter', 'PIL.Image', 'oracledb')
+
+
+def _prewarm_imports():
+    import importlib
+    for name in _PREWARM_MODULES:
+        try:
+            importlib.import_module(name)
+        except Exception:
+            pass  # The real import will surface the error
+
+
+def start_prewarm_imports():
+    """Warm-import heavy dependencies on a daemon thread."""
+    threading.Thread(target=_prewarm_imports, daemon=True).start()
+
 # --- Path Setup ---
 # Handle both frozen (PyInstaller) and development environments
 if getattr(sys, 'frozen', False):
@@ -130,14 +166,19 @@ except ImportError:
     LOG_DIR = None
 
     def compare_versions(v1, v2):
-        v1_parts = [int(x) for x in v1.lstrip('v').split('.')]
-        v2_parts = [int(x) for x in v2.lstrip('v').split('.')]
-        for a, b in zip(v1_parts, v2_parts):
-            if a < b:
-                return -1
-            elif a > b:
-                return 1
-        return 0
+        # Mirror of src.core.version.compare_versions, including the zero padding
+        a = tuple(int(x) for x in v1.lstrip('v').split('.'))
+        b = tuple(int(x) for x in v2.lstrip('v').split('.'))
+        max_len = max(len(a), len(b))
+        a += (0,) * (max_len - len(a))
+        b += (0,) * (max_len - len(b))
+        return (a > b) - (a < b)
+
+
+# (connect, read) timeouts for GitHub calls: connecting should be quick even
+# on slow links, so a dead network fails in seconds rather than the read budget.
+GITHUB_API_TIMEOUT = (3, 10)
+DOWNLOAD_TIMEOUT = (5, 120)
 
 
 class Launcher:
@@ -151,34 +192,47 @@ class Launcher:
         self.env_path = os.path.join(PROJECT_ROOT, '.env')
         self.wallet_path = os.path.join(PROJECT_ROOT, 'assets', 'wallet', 'cwallet.sso')
         self.update_config_path = os.path.join(PROJECT_ROOT, 'update_config.json')
+        self.update_cache_path = os.path.join(PROJECT_ROOT, 'update_cache.json')
+        self.native_host_state_path = os.path.join(PROJECT_ROOT, 'native_host_state.json')
+        self._http_session = None
+        self._creds_ok = None
+        self._update_thread = None
+        self._update_result = None
 
     def log(self, message, level="INFO"):
         """Print log message with level prefix."""
         if self.debug or level in ["ERROR", "WARNING"]:
             print(f"[{level}] {message}")
 
-    def check_credentials(self):
-        """Check if required credentials and identity exist."""
+    def check_credentials(self, refresh=False):
+        """
+        Check if required credentials and identity exist.
+        The result is memoized for the launcher's lifetime; pass refresh=True
+        to re-check (e.g. after the setup wizard has written new files).
+        """
+        if self._creds_ok is None or refresh:
+            self._creds_ok = self._check_credentials()
+        return self._creds_ok
+
+    def _check_credentials(self):
         # 1. Check for Operator Identity
-        op_config_exists = os.path.exists(os.path.join(PROJECT_ROOT, 'operator_config.json'))
-        if not op_config_exists:
+        if not os.path.exists(os.path.join(PROJECT_ROOT, 'operator_config.json')):
             self.log("Operator identity not found (operator_config.json missing).")
             return False
 
-        # 2. Check for Secure Setup Pack
-        has_secure = False
+        # 2. Legacy/Dev Check (cheapest: a single stat, no imports)
+        # Wallet is no longer required with TLS connection strings
+        if os.path.exists(self.env_path):
+            return True
+
+        # 3. Check for Secure Setup Pack
         try:
             from src.core.secrets_manager import SecretsManager
-            sm = SecretsManager()
-            if sm.zip_path:
-                has_secure = True
+            if SecretsManager().zip_path:
+                return True
         except Exception: pass
 
-        # 3. Legacy/Dev Check
-        # Wallet is no longer required with TLS connection strings
-        env_exists = os.path.exists(self.env_path)
-        
-        return op_config_exists and (has_secure or env_exists)
+        return False
 
     def run_setup_wizard(self):
         """Launch the setup wizard for first-time configuration."""
@@ -198,7 +252,7 @@ class Launcher:
                 return False
 
             print("[Launcher] Checking credentials after setup...")
-            result = self.check_credentials()
+            result = self.check_credentials(refresh=True)
             print(f"[Launcher] Credentials check result: {result}")
             return result
 
@@ -296,11 +350,39 @@ class Launcher:
             self.log(f"GUI Prompt failed: {e}", "ERROR")
             return None, None
 
+    def prefetch_update_check(self):
+        """
+        Start the update check on a background thread so the GitHub round-trip
+        overlaps with importing and building the main UI. The next call to
+        check_for_updates() consumes the result.
+        """
+        if self.skip_update or self._update_thread is not None:
+            return
+
+        def _worker():
+            self._update_result = self._run_update_check()
+
+        self._update_thread = threading.Thread(target=_worker, daemon=True)
+        self._update_thread.start()
+
     def check_for_updates(self):
         """
         Check GitHub Releases for a newer version.
         Returns (update_available, latest_version, download_url) or (False, None, None) on error.
         """
+        if self._update_thread is not None:
+            # Consume the prefetched result (once); later calls check afresh
+            self._update_thread.join(timeout=15)
+            self._update_thread = None
+            result, self._update_result = self._update_result, None
+            if result is None:
+                self.log("Background update check did not finish in time.", "WARNING")
+                return False, None, None
+            return result
+
+        return self._run_update_check()
+
+    def _run_update_check(self):
         if self.skip_update:
             self.log("Update check skipped (--skip-update flag)")
             return False, None, None
@@ -314,32 +396,16 @@ class Launcher:
 
         api_url = f"https://api.github.com/repos/{owner}/{repo}/releases/latest"
 
-        try:
-            request = urllib.request.Request(
-                api_url,
-                headers={
-                    'Accept': 'application/vnd.github.v3+json',
-                    'User-Agent': f'{__app_name__}/{__version__}'
-                }
-            )
+        import requests
 
-            with urllib.request.urlopen(request, timeout=10) as response:
-                data = json.loads(response.read().decode('utf-8'))
-
-            latest_tag = data.get('tag_name', '')
+        try:
+            latest_tag, download_url = self._fetch_latest_release(api_url)
             latest_version = latest_tag.lstrip('v')
 
             self.log(f"Latest release: {latest_tag}")
 
             # Compare versions
             if compare_versions(__version__, latest_version) < 0:
-                # Find the .exe asset
-                download_url = None
-                for asset in data.get('assets', []):
-                    if asset['name'].lower().endswith('.exe'):
-                        download_url = asset['browser_download_url']
-                        break
-
                 if download_url:
                     self.log(f"Update available: v{__version__} -> v{latest_version}")
                     return True, latest_version, download_url
@@ -350,14 +416,14 @@ class Launcher:
                 self.log("Already up to date.")
                 return False, None, None
 
-        except urllib.error.HTTPError as e:
-            if e.code == 404:
+        except requests.HTTPError as e:
+            if e.response is not None and e.response.status_code == 404:
                 self.log("No releases found on GitHub.", "WARNING")
             else:
                 self.log(f"GitHub API error: {e}", "WARNING")
             return False, None, None
 
-        except urllib.error.URLError as e:
+        except requests.RequestException as e:
             self.log(f"Network error checking updates: {e}", "WARNING")
             return False, None, None
 
@@ -365,6 +431,66 @@ class Launcher:
             self.log(f"Error checking updates: {e}", "WARNING")
             return False, None, None
 
+    def _fetch_latest_release(self, api_url):
+        """
+        Fetch the latest release tag and .exe download URL from GitHub.
+        Uses a cached ETag (If-None-Match) so an unchanged release costs a
+        bodyless 304 instead of the full JSON. Returns (tag_name, download_url).
+        """
+        headers = {'Accept': 'application/vnd.github.v3+json'}
+
+        cache = self._load_state_file(self.update_cache_path)
+        if cache.get('api_url') == api_url and cache.get('etag'):
+            headers['If-None-Match'] = cache['etag']
+
+        response = self._get_http_session().get(api_url, headers=headers, timeout=GITHUB_API_TIMEOUT)
+        if response.status_code == 304:
+            self.log("Release unchanged since last check (304 Not Modified).")
+            return cache.get('tag', ''), cache.get('url')
+        response.raise_for_status()
+
+        etag = response.headers.get('ETag')
+        data = response.json()
+        latest_tag = data.get('tag_name', '')
+
+        # Find the .exe asset
+        download_url = None
+        for asset in data.get('assets', []):
+            if asset['name'].lower().endswith('.exe'):
+                download_url = asset['browser_download_url']
+                break
+
+        if etag:
+            self._save_state_file(self.update_cache_path, {'api_url': api_url, 'etag': etag, 'tag': latest_tag, 'url': download_url})
+
+        return latest_tag, download_url
+
+    def _get_http_session(self):
+        """
+        Lazily create the requests.Session shared by the update check and the
+        download, so keep-alive connections are reused across both.
+        """
+        if self._http_session is None:
+            import requests
+            self._http_session = requests.Session()
+            self._http_session.headers.update({'User-Agent': f'{__app_name__}/{__version__}'})
+        return self._http_session
+
+    def _load_state_file(self, path):
+        """Load a small JSON state/cache file ({} if missing or corrupt)."""
+        try:
+            with open(path, 'r') as f:
+                return json.load(f)
+        except Exception:
+            return {}
+
+    def _save_state_file(self, path, data):
+        try:
+            with open(path, 'w') as f:
+                json.dump(data, f)
+        except Exception as e:
+            self.log(f"Failed to save {os.path.basename(path)}: {e}", "WARNING")
+
     def download_update(self, download_url, new_version):
         """
         Download the update from the given URL.
@@ -372,30 +498,32 @@ class Launcher:
         """
         self.log(f"Downloading update from: {download_url}")
 
+        temp_dir = None
         try:
-            # Create temp file for download
-            temp_dir = tempfile.mkdtemp(prefix="instalogger_update_")
+            # Create temp file for download. When frozen, stage it next to the
+            # exe so apply_update can swap it in with a rename instead of a copy.
+            if getattr(sys, 'frozen', False):
+                temp_dir = tempfile.mkdtemp(prefix=".update_", dir=os.path.dirname(sys.executable))
+            else:
+                temp_dir = tempfile.mkdtemp(prefix="instalogger_update_")
             temp_file = os.path.join(temp_dir, f"InstaLogger_v{new_version}.exe")
 
-            request = urllib.request.Request(
-                download_url,
-                headers={'User-Agent': f'{__app_name__}/{__version__}'}
-            )
-
-            with urllib.request.urlopen(request, timeout=120) as response:
+            with self._get_http_session().get(download_url, stream=True, timeout=DOWNLOAD_TIMEOUT) as response:
+                response.raise_for_status()
                 total_size = int(response.headers.get('content-length', 0))
                 downloaded = 0
-                chunk_size = 8192
+                last_print = 0
+                chunk_size = 1 << 18  # 256 KiB
+                # Refresh progress at most ~50 times instead of on every chunk
+                print_step = max(total_size // 50, chunk_size)
 
                 with open(temp_file, 'wb') as f:
-                    while True:
-                        chunk = response.read(chunk_size)
-                        if not chunk:
-                            break
+                    for chunk in response.iter_content(chunk_size=chunk_size):
                         f.write(chunk)
                         downloaded += len(chunk)
 
-                        if total_size > 0:
+                        if total_size > 0 and (downloaded - last_print >= print_step or downloaded >= total_size):
+                            last_print = downloaded
                             percent = (downloaded / total_size) * 100
                             print(f"\rDownloading... {percent:.1f}%", end='', flush=True)
 
@@ -406,6 +534,9 @@ class Launcher:
 
         except Exception as e:
             self.log(f"Download failed: {e}", "ERROR")
+            # The staging dir may sit next to the exe, where nothing cleans it up
+            if temp_dir:
+                shutil.rmtree(temp_dir, ignore_errors=True)
             return None
 
     def apply_update(self, update_path):
@@ -425,15 +556,19 @@ class Launcher:
             self.log(f"  Current: {current_exe}")
             self.log(f"  New: {update_path}")
 
-            # Remove old backup if exists
-            if os.path.exists(backup_exe):
-                os.remove(backup_exe)
+            # Rename current exe to .old (os.replace overwrites any stale backup)
+            os.replace(current_exe, backup_exe)
 
-            # Rename current exe to .old
-            os.rename(current_exe, backup_exe)
+            # Move new exe into place (a plain rename when staged on the same volume)
+            try:
+                os.replace(update_path, current_exe)
+            except OSError:
+                shutil.move(update_path, current_exe)
 
-            # Move new exe into place
-            shutil.move(update_path, current_exe)
+            try:
+                os.rmdir(os.path.dirname(update_path))
+            except OSError:
+                pass
 
             self.log("Update applied successfully!")
             self.log("Restarting application...")
@@ -447,9 +582,11 @@ class Launcher:
 
             # Try to restore backup
             if os.path.exists(backup_exe) and not os.path.exists(current_exe):
-                os.rename(backup_exe, current_exe)
+                os.replace(backup_exe, current_exe)
                 self.log("Restored backup executable.")
 
+            # Drop the staged download so failed attempts don't pile up
+            shutil.rmtree(os.path.dirname(update_path), ignore_errors=True)
             return False
 
     def prompt_for_update(self, new_version, download_url):
@@ -458,6 +595,9 @@ class Launcher:
             import tkinter as tk
             from tkinter import messagebox as mb
 
+            # The user takes seconds to answer; load the main app's deps meanwhile
+            start_prewarm_imports()
+
             root = tk.Tk()
             root.withdraw()
 
@@ -482,6 +622,9 @@ class Launcher:
         print("[Launcher] Preparing to launch main app...")
 
         try:
+            # Overlap dependency imports with unlocking the Setup Pack
+            start_prewarm_imports()
+
             # Change to project root directory
             print(f"[Launcher] Changing directory to: {PROJECT_ROOT}")
             os.chdir(PROJECT_ROOT)
@@ -507,6 +650,9 @@ class Launcher:
                         app = AppUI(launcher=self)
                         print("DEBUG_TRACE: AppUI allocated. Setting protocol...")
                         app.protocol("WM_DELETE_WINDOW", app.on_closing)
+                        # Ctrl+C in the console takes the same shutdown path as closing
+                        # the window (on_closing only stops the server if it is running)
+                        signal.signal(signal.SIGINT, lambda *_: app.after(0, app.on_closing))
                         print("DEBUG_TRACE: Entering mainloop...")
                         app.mainloop()
                         print("DEBUG_TRACE: Exited mainloop.")
@@ -568,30 +714,54 @@ class Launcher:
             bridge_path = os.path.abspath(bridge_path)
             manifest_path = os.path.join(os.path.dirname(bridge_path), 'com.instaoutreach.logger.json')
 
-            if not os.path.exists(manifest_path):
+            try:
+                manifest_mtime = os.stat(manifest_path).st_mtime_ns
+            except FileNotFoundError:
                 self.log(f"Manifest json not found at {manifest_path}. Skipping registration repair.", "WARNING")
                 return
 
-            # 2. Update Manifest 'path' to current location
-            with open(manifest_path, 'r') as f:
-                manifest_data = json.load(f)
+            # Fast path: nothing moved and the manifest is untouched since we last checked it
+            expected_state = {
+                'bridge_path': bridge_path,
+                'manifest_path': manifest_path,
+                'manifest_mtime': manifest_mtime
+            }
+            manifest_unchanged = self._load_state_file(self.native_host_state_path) == expected_state
 
-            current_json_path = manifest_data.get('path', '')
-            if current_json_path != bridge_path:
-                self.log(f"Repairing manifest path: {bridge_path}")
-                manifest_data['path'] = bridge_path
-                with open(manifest_path, 'w') as f:
-                    json.dump(manifest_data, f, indent=4)
-
-            # 3. Update Windows Registry
+            # 2. Update Manifest 'path' to current location
+            if not manifest_unchanged:
+                with open(manifest_path, 'r') as f:
+                    manifest_data = json.load(f)
+
+                current_json_path = manifest_data.get('path', '')
+                if current_json_path != bridge_path:
+                    self.log(f"Repairing manifest path: {bridge_path}")
+                    manifest_data['path'] = bridge_path
+                    with open(manifest_path, 'w') as f:
+                        json.dump(manifest_data, f, indent=4)
+
+            # 3. Update Windows Registry (always checked: other installs or
+            # dev_launcher can repoint the key without touching our manifest)
             reg_path = r"Software\Google\Chrome\NativeMessagingHosts\com.instaoutreach.logger"
             try:
-                key = winreg.CreateKey(winreg.HKEY_CURRENT_USER, reg_path)
-                winreg.SetValueEx(key, "", 0, winreg.REG_SZ, manifest_path)
-                winreg.CloseKey(key)
+                access = winreg.KEY_READ | winreg.KEY_WRITE
+                with winreg.CreateKeyEx(winreg.HKEY_CURRENT_USER, reg_path, 0, access) as key:
+                    try:
+                        current_value, _ = winreg.QueryValueEx(key, "")
+                    except FileNotFoundError:
+                        current_value = None
+                    # A read is far cheaper than a write (no hive flush)
+                    if current_value != manifest_path:
+                        winreg.SetValueEx(key, "", 0, winreg.REG_SZ, manifest_path)
                 self.log(f"Registry key verified/updated: {reg_path}")
             except Exception as e:
                 self.log(f"Failed to update registry: {e}", "ERROR")
+                return
+
+            # Remember the manifest we verified (re-stat: it may have just been rewritten)
+            if not manifest_unchanged:
+                expected_state['manifest_mtime'] = os.stat(manifest_path).st_mtime_ns
+                self._save_state_file(self.native_host_state_path, expected_state)
 
         except Exception as e:
             self.log(f"Registration repair failed: {e}", "ERROR")
@@ -742,6 +912,10 @@ class Launcher:
         print("[Launcher] Step 1.5: Verifying Native Host Registration...")
         self.ensure_native_host_registration()
 
+        # Overlap the GitHub release check with the main app import/startup;
+        # the welcome screen picks up the result.
+        self.prefetch_update_check()
+
         # Step 2: Show Welcome Window (GUI Dashboard)
         # Replaces the old CLI loop and manual update check
         
@@ -749,8 +923,26 @@ class Launcher:
         self.launch_main_app()
 
 
+def run_bridge():
+    """Run in Native Messaging Bridge mode (invoked by Chrome via bridge.bat)."""
+    try:
+        from src.core.bridge import main as bridge_main
+        bridge_main()
+    except ImportError as e:
+        # Fallback logging if imports fail in bridge mode
+        with open('bridge_startup_error.log', 'w') as f:
+            f.write(f"Failed to start bridge: {e}")
+
+
 def main():
     """Entry point with argument parsing."""
+    # Fast path: Chrome starts a bridge per native-messaging session, so skip
+    # building the argparse parser entirely in that mode.
+    if '--bridge' in sys.argv[1:]:
+        run_bridge()
+        return
+
+    import argparse
     parser = argparse.ArgumentParser(
         description=f"{__app_name__} Launcher"
     )
@@ -777,15 +969,9 @@ def main():
 
     args = parser.parse_args()
 
-    # Special Mode: Bridge
+    # Special Mode: Bridge (normally handled by the fast path above)
     if args.bridge:
-        try:
-            from src.core.bridge import main as bridge_main
-            bridge_main()
-        except ImportError as e:
-            # Fallback logging if imports fail in bridge mode
-            with open('bridge_startup_error.log', 'w') as f:
-                f.write(f"Failed to start bridge: {e}")
+        run_bridge()
         return
 
     launcher = Launcher(
@@ -21,6 +21,12 @@ else:
 
 DB_PATH = PROJECT_ROOT / "local_data.db"
 
+# Tables touched by add_indexes (ANALYZE only these, not the whole DB)
+ANALYZED_TABLES = ("event_logs", "prospects", "rules", "goals")
+
+# VACUUM rewrites the whole file; only worth it past this many free pages
+VACUUM_MIN_FREE_PAGES = 1000
+
 
 def add_indexes(conn):
     """
@@ -61,6 +67,9 @@ def add_indexes(conn):
     
     print("[Migration] Adding database indexes for performance...")
     
+    # sqlite3 does not open an implicit transaction for DDL, so without this
+    # every CREATE INDEX would commit (and sync the journal) on its own.
+    cursor.execute("BEGIN")
     for index_name, index_sql in indexes:
         try:
             cursor.execute(index_sql)
@@ -74,14 +83,18 @@ def add_indexes(conn):
 
 def analyze_database(conn):
     """
-    Run ANALYZE to update statistics for the query optimizer.
+    Run ANALYZE on the indexed tables to update statistics for the query optimizer.
     
     Args:
         conn: SQLite connection object.
     """
     cursor = conn.cursor()
     print("[Migration] Analyzing database for query optimization...")
-    cursor.execute("ANALYZE")
+    for table in ANALYZED_TABLES:
+        try:
+            cursor.execute(f"ANALYZE {table}")
+        except sqlite3.Error as e:
+            print(f"[Migration] ⚠ Warning analyzing {table}: {e}")
     conn.commit()
     print("[Migration] ✓ Database analysis completed.")
 
@@ -89,10 +102,15 @@ def analyze_database(conn):
 def vacuum_database(conn):
     """
     Run VACUUM to optimize database file size and performance.
+    Skipped when there are too few free pages to be worth rewriting the file.
     
     Args:
         conn: SQLite connection object.
     """
+    free_pages = conn.execute("PRAGMA freelist_count").fetchone()[0]
+    if free_pages < VACUUM_MIN_FREE_PAGES:
+        print(f"[Migration] Skipping vacuum ({free_pages} free pages).")
+        return
     print("[Migration] Vacuuming database (this may take a moment)...")
     conn.execute("VACUUM")
     print("[Migration] ✓ Database vacuum completed.")
@@ -110,6 +128,13 @@ def main():
     try:
         conn = sqlite3.connect(str(DB_PATH))
         
+        # Connection-level tuning for the bulk index build. journal_mode is
+        # left alone: WAL is persistent and LocalDatabase's .bak copy assumes
+        # a single-file database.
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("PRAGMA temp_store=MEMORY")
+        conn.execute("PRAGMA cache_size=-65536")  # 64 MiB
+        
         # Add indexes
         add_indexes(conn)
         
@@ -11,6 +11,9 @@ def check_oracle_schema():
         print("Connected to Oracle.")
         with db.get_connection() as conn:
             with conn.cursor() as cursor:
+                # Fetch the whole column list in one round-trip
+                cursor.arraysize = 1000
+                cursor.prefetchrows = 1001
                 cursor.execute("SELECT column_name, data_type FROM user_tab_columns WHERE table_name = 'PROSPECTS'")
                 columns = cursor.fetchall()
                 print("Columns in PROSPECTS table:")
@@ -4,7 +4,7 @@ import compileall
 
 def check_syntax(start_dir):
     print(f"Checking Python syntax in {start_dir}...")
-    success = compileall.compile_dir(start_dir, force=True, quiet=1)
+    success = compileall.compile_dir(start_dir, force=True, quiet=1, workers=os.cpu_count() or 1)
     if success:
         print("No Python syntax errors found.")
     else:
@@ -1,9 +1,14 @@
 
+import os
+import sys
 import base64
-import hashlib
 from cryptography.hazmat.primitives.asymmetric import rsa
 from cryptography.hazmat.primitives import serialization
 
+# Add project root to path so we can import 'src'
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from src.core.extension_id import extension_id
+
 def generate_key():
     # 1. Generate Private Key
     private_key = rsa.generate_private_key(
@@ -19,21 +24,11 @@ def generate_key():
     )
     
     # 3. Calculate Extension ID
-    # SHA256 hash of DER public key
-    sha = hashlib.sha256(der_key).hexdigest()
-    # First 32 chars (16 bytes)
-    prefix = sha[:32]
-    # Convert hex (0-f) to (a-p)
-    # 0->a, 1->b, ... f->p
-    # Actually, the algorithm is:
+    # Chrome's algorithm:
     # 1. SHA256 of public key
     # 2. Take first 128 bits (16 bytes)
     # 3. Convert to base16 using 'a'-'p' alphabet
-    
-    ext_id = ""
-    for char in prefix:
-        val = int(char, 16)
-        ext_id += chr(ord('a') + val)
+    ext_id = extension_id(der_key)
 
     # 4. Base64 encode for manifest "key" field
     b64_key = base64.b64encode(der_key).decode('utf-8')
@@ -1,32 +1,43 @@
 import os
+import sys
 import json
 import base64
-import hashlib
 from cryptography.hazmat.primitives.asymmetric import rsa
 from cryptography.hazmat.primitives import serialization
 
+# Add project root to path so we can import 'src'
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from src.core.extension_id import extension_id
+
 project_root = os.getcwd()
 key_path = os.path.join(project_root, 'src', 'extension', 'key.pem')
 manifest_path = os.path.join(project_root, 'src', 'extension', 'manifest.json')
 nh_manifest_path = os.path.join(project_root, 'src', 'core', 'com.instaoutreach.logger.json')
 
-def generate_key():
-    print("Generating key...")
-    # Generate Key
-    private_key = rsa.generate_private_key(
-        public_exponent=65537,
-        key_size=2048,
-    )
-    
-    # Save Private Key
-    pem = private_key.private_bytes(
-        encoding=serialization.Encoding.PEM,
-        format=serialization.PrivateFormat.PKCS8,
-        encryption_algorithm=serialization.NoEncryption()
-    )
-    with open(key_path, 'wb') as f:
-        f.write(pem)
-    print(f"Saved private key to {key_path}")
+def generate_key(force=False):
+    if os.path.exists(key_path) and not force:
+        # Reuse the existing keypair (keeps the extension ID stable and skips
+        # RSA prime generation). Pass --force to generate a new one.
+        print(f"Reusing existing key at {key_path} (use --force to regenerate)")
+        with open(key_path, 'rb') as f:
+            private_key = serialization.load_pem_private_key(f.read(), password=None)
+    else:
+        print("Generating key...")
+        # Generate Key
+        private_key = rsa.generate_private_key(
+            public_exponent=65537,
+            key_size=2048,
+        )
+        
+        # Save Private Key
+        pem = private_key.private_bytes(
+            encoding=serialization.Encoding.PEM,
+            format=serialization.PrivateFormat.PKCS8,
+            encryption_algorithm=serialization.NoEncryption()
+        )
+        with open(key_path, 'wb') as f:
+            f.write(pem)
+        print(f"Saved private key to {key_path}")
 
     # Get Public Key DER
     public_key = private_key.public_key()
@@ -48,9 +59,7 @@ def generate_key():
         print(f"Error: {manifest_path} not found.")
 
     # Calculate ID
-    sha = hashlib.sha256(der_key).hexdigest()
-    prefix = sha[:32]
-    ext_id = "".join([chr(ord('a') + int(char, 16)) for char in prefix])
+    ext_id = extension_id(der_key)
     print(f"Extension ID: {ext_id}")
 
     # Update Native Host Manifest
@@ -65,4 +74,4 @@ def generate_key():
         print(f"Error: {nh_manifest_path} not found.")
 
 if __name__ == "__main__":
-    generate_key()
+    generate_key(force='--force' in sys.argv[1:])
@@ -1,7 +1,6 @@
 
 import sys
 import os
-import time
 
 # Add src to path
 current_dir = os.path.dirname(os.path.abspath(__file__))
@@ -22,17 +21,18 @@ def test_generation():
         # Using a dummy root to prevent some issues if SetupWizard expects one?
         # SetupWizard IS a root (ctk.CTk).
         
-        # We need to wait a bit for the thread to finish.
+        # We need to wait for the thread to finish.
         
         app = SetupWizard()
         # The thread starts in __init__
         
         print("Waiting for thread...")
-        time.sleep(3) # Wait for thread to write files
-        
-        # Check files
         key_path = os.path.join(current_dir, 'src', 'extension', 'key.pem')
-        if os.path.exists(key_path):
+        
+        # Check files (wait() returns as soon as the thread is done)
+        if not app.id_gen_done.wait(timeout=10):
+            print("FAILURE: ID generation thread did not finish.")
+        elif os.path.exists(key_path):
             print(f"SUCCESS: key.pem found at {key_path}")
         else:
             print("FAILURE: key.pem not found.")
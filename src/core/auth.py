@@ -7,16 +7,17 @@ import os
 import json
 import pickle
 import base64
+import functools
+import getpass
+import hashlib
+import platform
 import threading
 import webbrowser
-from google_auth_oauthlib.flow import InstalledAppFlow
-from google.auth.transport.requests import Request
-from google.oauth2.credentials import Credentials
-from cryptography.fernet import Fernet
-from cryptography.hazmat.primitives import hashes
-from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
 import sys
 
+# Google/OAuth and cryptography imports are deferred to the methods that use
+# them: they pull in hundreds of modules and most launches only need decrypt.
+
 # Define scopes required
 SCOPES = [
     'openid',
@@ -30,81 +31,190 @@ if getattr(sys, 'frozen', False):
 else:
     PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
 
+USERINFO_URL = 'https://www.googleapis.com/oauth2/v2/userinfo'
+
 CREDENTIALS_PATH = os.path.join(PROJECT_ROOT, 'assets', 'client_secret.json')
 TOKEN_PATH = os.path.join(PROJECT_ROOT, 'token.pickle')
 SECURE_TOKEN_PATH = os.path.join(PROJECT_ROOT, 'token.enc')
+KEY_CACHE_PATH = os.path.join(PROJECT_ROOT, 'token.key')
+
+# Salt stored locally (not secret, just prevents rainbow tables)
+_KEY_SALT = b'IOL_TOKEN_SALT_v1'
+
+# Machine-specific identifier (hostname + username), resolved once per process
+_MACHINE_ID = f"{platform.node()}-{getpass.getuser()}".encode()
+
+def _dpapi(data, protect):
+    """Wrap/unwrap bytes with Windows DPAPI (bound to the current Windows user)."""
+    import ctypes
+    from ctypes import wintypes
+
+    class DATA_BLOB(ctypes.Structure):
+        _fields_ = [('cbData', wintypes.DWORD), ('pbData', ctypes.POINTER(ctypes.c_char))]
+
+    buf = ctypes.create_string_buffer(data, len(data))
+    blob_in = DATA_BLOB(len(data), ctypes.cast(buf, ctypes.POINTER(ctypes.c_char)))
+    blob_out = DATA_BLOB()
+    crypt32 = ctypes.windll.crypt32
+    func = crypt32.CryptProtectData if protect else crypt32.CryptUnprotectData
+    CRYPTPROTECT_UI_FORBIDDEN = 0x1
+    if not func(ctypes.byref(blob_in), None, None, None, None,
+                CRYPTPROTECT_UI_FORBIDDEN, ctypes.byref(blob_out)):
+        raise ctypes.WinError()
+    try:
+        return ctypes.string_at(blob_out.pbData, blob_out.cbData)
+    finally:
+        kernel32 = ctypes.windll.kernel32
+        kernel32.LocalFree.argtypes = [ctypes.c_void_p]
+        kernel32.LocalFree(ctypes.cast(blob_out.pbData, ctypes.c_void_p))
+
+def _load_cached_key(machine_hash):
+    """Return the cached key if it was derived for this machine, else None."""
+    try:
+        with open(KEY_CACHE_PATH, 'r') as f:
+            cached = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if cached.get('machine_hash') != machine_hash:
+        return None
+    key = cached.get('key')
+    if not key:
+        return None
+    if sys.platform == 'win32':
+        # A plaintext cache from an older build is re-derived and re-saved wrapped
+        if not cached.get('dpapi'):
+            return None
+        try:
+            return _dpapi(base64.b64decode(key), protect=False)
+        except (OSError, ValueError):
+            return None
+    return key.encode()
 
+def _save_cached_key(machine_hash, key):
+    """
+    Persist the derived key. On Windows it is wrapped with DPAPI so only the
+    same Windows user can unwrap it; elsewhere the file is created 0600.
+    """
+    try:
+        if sys.platform == 'win32':
+            cached = {'machine_hash': machine_hash, 'dpapi': True,
+                      'key': base64.b64encode(_dpapi(key, protect=True)).decode()}
+        else:
+            cached = {'machine_hash': machine_hash, 'key': key.decode()}
+        fd = os.open(KEY_CACHE_PATH, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, 'w') as f:
+            json.dump(cached, f)
+    except OSError as e:
+        print(f"[Auth] Could not cache encryption key: {e}")
+
+@functools.lru_cache(maxsize=1)
 def _get_encryption_key():
     """
     Generate a machine-specific encryption key for token storage.
     Uses a combination of machine-specific data and a salt.
+    The derived key is cached in token.key so PBKDF2 only runs on first use
+    (or when the hostname/username changes).
     """
-    # Use machine-specific identifier (hostname + username)
-    import platform
-    import getpass
-    machine_id = f"{platform.node()}-{getpass.getuser()}".encode()
-    
-    # Salt stored locally (not secret, just prevents rainbow tables)
-    salt = b'IOL_TOKEN_SALT_v1'
+    machine_hash = hashlib.sha256(_MACHINE_ID + _KEY_SALT).hexdigest()
+
+    key = _load_cached_key(machine_hash)
+    if key:
+        return key
     
     # Derive key using PBKDF2HMAC
+    from cryptography.hazmat.primitives import hashes
+    from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
     kdf = PBKDF2HMAC(
         algorithm=hashes.SHA256(),
         length=32,
-        salt=salt,
+        salt=_KEY_SALT,
         iterations=100000,
     )
-    key = base64.urlsafe_b64encode(kdf.derive(machine_id))
+    key = base64.urlsafe_b64encode(kdf.derive(_MACHINE_ID))
+    _save_cached_key(machine_hash, key)
     return key
 
+@functools.lru_cache(maxsize=1)
+def _get_cipher():
+    """AES-256-GCM over the raw 32-byte key (token.enc = nonce + ciphertext)."""
+    from cryptography.hazmat.primitives.ciphers.aead import AESGCM
+    return AESGCM(base64.urlsafe_b64decode(_get_encryption_key()))
+
 class AuthManager:
     def __init__(self):
         self.creds = None
         self.user_info = None
+        self._session = None
+        self._last_saved_hash = None
         self._encryption_key = _get_encryption_key()
-        self._fernet = Fernet(self._encryption_key)
+        self._aes = _get_cipher()
+
+    def _decrypt(self, data):
+        """Decrypt token.enc contents, migrating legacy Fernet blobs in place."""
+        from cryptography.exceptions import InvalidTag
+        try:
+            return self._aes.decrypt(data[:12], data[12:], None), False
+        except InvalidTag:
+            # Written by an older version with Fernet (same derived key)
+            from cryptography.fernet import Fernet
+            return Fernet(self._encryption_key).decrypt(data), True
 
     def _migrate_from_pickle(self):
         """Migrate from old pickle format to new encrypted format."""
-        if os.path.exists(TOKEN_PATH) and not os.path.exists(SECURE_TOKEN_PATH):
-            try:
-                with open(TOKEN_PATH, 'rb') as token:
-                    creds = pickle.load(token)
-                    # Convert to new format
-                    self.creds = creds
-                    self.save_token()
-                    print("[Auth] Migrated token from pickle to encrypted format.")
-                    # Keep old file as backup for now
-                    os.rename(TOKEN_PATH, TOKEN_PATH + '.backup')
-                    return True
-            except Exception as e:
-                print(f"[Auth] Failed to migrate token: {e}")
-                return False
-        return False
+        try:
+            with open(TOKEN_PATH, 'rb') as token:
+                creds = pickle.load(token)
+        except FileNotFoundError:
+            return False
+        except Exception as e:
+            print(f"[Auth] Failed to migrate token: {e}")
+            return False
+
+        try:
+            # Convert to new format
+            self.creds = creds
+            self.save_token()
+            print("[Auth] Migrated token from pickle to encrypted format.")
+            # Delete the pickle so it is never loaded (or probed for) again
+            os.remove(TOKEN_PATH)
+            return True
+        except Exception as e:
+            print(f"[Auth] Failed to migrate token: {e}")
+            return False
 
     def load_token(self):
         """Load existing token if valid. Supports migration from pickle format."""
-        # Try to migrate from old format first
-        if os.path.exists(TOKEN_PATH):
+        from google.oauth2.credentials import Credentials
+        from google.auth.transport.requests import Request
+
+        # Load from encrypted format (a single open, no exists() pre-checks)
+        try:
+            with open(SECURE_TOKEN_PATH, 'rb') as token_file:
+                encrypted_data = token_file.read()
+        except FileNotFoundError:
+            # No encrypted token yet, try to migrate from the old pickle format
             self._migrate_from_pickle()
-        
-        # Load from encrypted format
-        if os.path.exists(SECURE_TOKEN_PATH):
+        except OSError as e:
+            print(f"[Auth] Token load failed: {e}")
+            self.creds = None
+        else:
             try:
-                with open(SECURE_TOKEN_PATH, 'rb') as token_file:
-                    encrypted_data = token_file.read()
-                    decrypted_data = self._fernet.decrypt(encrypted_data)
-                    token_dict = json.loads(decrypted_data.decode('utf-8'))
-                    
-                    # Reconstruct credentials object
-                    self.creds = Credentials(
-                        token=token_dict.get('token'),
-                        refresh_token=token_dict.get('refresh_token'),
-                        token_uri=token_dict.get('token_uri'),
-                        client_id=token_dict.get('client_id'),
-                        client_secret=token_dict.get('client_secret'),
-                        scopes=token_dict.get('scopes')
-                    )
+                decrypted_data, legacy = self._decrypt(encrypted_data)
+                token_dict = json.loads(decrypted_data.decode('utf-8'))
+                
+                # Reconstruct credentials object
+                self.creds = Credentials(
+                    token=token_dict.get('token'),
+                    refresh_token=token_dict.get('refresh_token'),
+                    token_uri=token_dict.get('token_uri'),
+                    client_id=token_dict.get('client_id'),
+                    client_secret=token_dict.get('client_secret'),
+                    scopes=token_dict.get('scopes')
+                )
+                if legacy:
+                    self.save_token()
+                else:
+                    self._last_saved_hash = self._creds_hash()
             except Exception as e:
                 print(f"[Auth] Token load failed: {e}")
                 self.creds = None
@@ -117,10 +227,16 @@ class AuthManager:
                 print(f"[Auth] Token refresh failed: {e}")
                 self.creds = None
 
+    def _creds_hash(self):
+        return hash((self.creds.token, self.creds.refresh_token, str(self.creds.expiry)))
+
     def save_token(self):
-        """Save credentials to disk in encrypted format."""
+        """Save credentials to disk in encrypted format (skipped if unchanged)."""
         if not self.creds:
             return
+        creds_hash = self._creds_hash()
+        if creds_hash == self._last_saved_hash:
+            return
         
         try:
             # Convert credentials to dictionary
@@ -136,27 +252,17 @@ class AuthManager:
             
             # Encrypt and save
             json_data = json.dumps(token_dict).encode('utf-8')
-            encrypted_data = self._fernet.encrypt(json_data)
+            nonce = os.urandom(12)
+            encrypted_data = self._aes.encrypt(nonce, json_data, None)
             
             with open(SECURE_TOKEN_PATH, 'wb') as token_file:
-                token_file.write(encrypted_data)
+                token_file.write(nonce + encrypted_data)
+            self._last_saved_hash = creds_hash
                 
         except Exception as e:
             print(f"[Auth] Token save failed: {e}")
             raise
 
-    def logout(self):
-        """Sign out by deleting the local token file."""
-        try:
-            if os.path.exists(SECURE_TOKEN_PATH):
-                os.remove(SECURE_TOKEN_PATH)
-            self.creds = None
-            self.user_info = None
-            return True
-        except Exception as e:
-            print(f"[Auth] Logout failed: {e}")
-            return False
-
     def login(self):
         """
         Initiates the Google OAuth 2.0 flow.
@@ -188,6 +294,8 @@ class AuthManager:
                 return None, f"Missing 'client_secret.json' in assets/ AND missing GOOGLE_CLIENT_ID/SECRET in .env."
 
         try:
+            from google_auth_oauthlib.flow import InstalledAppFlow
+
             # 2. Run Flow
             if client_config:
                 flow = InstalledAppFlow.from_client_config(client_config, SCOPES)
@@ -210,20 +318,31 @@ class AuthManager:
         if not self.creds or not self.creds.valid:
             return None
 
-        from googleapiclient.discovery import build
-        service = build('oauth2', 'v2', credentials=self.creds)
-        self.user_info = service.userinfo().get().execute()
+        # Plain authorized GET on the userinfo endpoint (what the discovery
+        # client does under the hood, minus building the service every call)
+        if self._session is None or self._session.credentials is not self.creds:
+            from google.auth.transport.requests import AuthorizedSession
+            self._session = AuthorizedSession(self.creds)
+        response = self._session.get(USERINFO_URL, timeout=10)
+        response.raise_for_status()
+        self.user_info = response.json()
         return self.user_info
 
     def logout(self):
         """Clear local session."""
-        if os.path.exists(SECURE_TOKEN_PATH):
-            os.remove(SECURE_TOKEN_PATH)
         # Also remove old pickle file if it exists
-        if os.path.exists(TOKEN_PATH):
-            os.remove(TOKEN_PATH)
+        for path in (SECURE_TOKEN_PATH, TOKEN_PATH):
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+            except OSError as e:
+                print(f"[Auth] Logout failed: {e}")
+                return False
         self.creds = None
         self.user_info = None
+        self._session = None
+        self._last_saved_hash = None
         return True
 
     def get_authenticated_user(self):
@@ -3,30 +3,67 @@ import sys
 import struct
 import json
 import socket
+import selectors
 import logging
+import logging.handlers
+import queue
+import atexit
 import time
 import os
 import hmac
-import hashlib
+
+try:
+    import orjson
+
+    def _dumps(obj) -> bytes:
+        return orjson.dumps(obj)
+
+    _loads = orjson.loads
+except ImportError:
+    # orjson not available, stdlib json is a drop-in (if slower) fallback
+    def _dumps(obj) -> bytes:
+        return json.dumps(obj).encode('utf-8')
+
+    def _loads(data):
+        # json.loads takes bytes/bytearray but not memoryview
+        return json.loads(bytes(data) if isinstance(data, memoryview) else data)
 
 # --- Configuration ---
 # 1MB max message size
 MAX_MSG_SIZE = 1024 * 1024
 
-# Load .env file from project root (bridge.py is in src/core/, so go up 2 levels)
+# Seconds to wait for the IPC server to answer a forwarded message
+IPC_RESPONSE_TIMEOUT = 30.0
+
+# Message types the IPC server sends unprompted (broadcasts), not as replies
+_PUSH_TYPES = frozenset({'SYNC_COMPLETED'})
+
+# Frame headers: Chrome uses native byte order, the IPC server big-endian
+_HDR_NATIVE = struct.Struct('@I')
+_HDR_BE = struct.Struct('>I')
+_HDR_SIZE = _HDR_NATIVE.size
+
+# Reused receive buffers for Chrome and IPC messages (no per-message allocation)
+_STDIN_BUF = memoryview(bytearray(MAX_MSG_SIZE))
+_IPC_BUF = memoryview(bytearray(MAX_MSG_SIZE))
+
+# .env file in project root (bridge.py is in src/core/, so go up 2 levels)
+_BRIDGE_DIR = os.path.dirname(os.path.abspath(__file__))
+_PROJECT_ROOT = os.path.abspath(os.path.join(_BRIDGE_DIR, '..', '..'))
+_ENV_PATH = os.path.join(_PROJECT_ROOT, '.env')
 _ENV_LOADED = False
-_ENV_PATH = None
-try:
-    from dotenv import load_dotenv
-    # Determine project root based on this file's location
-    _BRIDGE_DIR = os.path.dirname(os.path.abspath(__file__))
-    _PROJECT_ROOT = os.path.abspath(os.path.join(_BRIDGE_DIR, '..', '..'))
-    _ENV_PATH = os.path.join(_PROJECT_ROOT, '.env')
-    if os.path.exists(_ENV_PATH):
-        load_dotenv(_ENV_PATH)
-        _ENV_LOADED = True
-except ImportError:
-    pass  # dotenv not available, rely on system environment
+
+def _load_env():
+    """Load the project .env. dotenv is only imported when there is a file to read."""
+    global _ENV_LOADED
+    if not os.path.exists(_ENV_PATH):
+        return
+    try:
+        from dotenv import load_dotenv
+    except ImportError:
+        return  # dotenv not available, rely on system environment
+    load_dotenv(_ENV_PATH)
+    _ENV_LOADED = True
 
 # Import centralized IPC port
 try:
@@ -39,17 +76,36 @@ except ImportError:
 def _load_ipc_auth_key():
     """Load IPC authentication key from environment variable with fallback."""
     auth_key_str = os.environ.get('IOL_IPC_AUTH_KEY')
+    if not auth_key_str:
+        # Not in the process environment, try the .env file
+        _load_env()
+        auth_key_str = os.environ.get('IOL_IPC_AUTH_KEY')
     if not auth_key_str:
         # Fallback for backward compatibility
         return b"insta_lead_secret_key"
     return auth_key_str.encode('utf-8')
 
-AUTH_KEY = _load_ipc_auth_key()  # Must match server
+AUTH_KEY = None  # Must match server; resolved by _get_auth_key() on first use
+
+# HMAC already keyed with AUTH_KEY; copies skip the ipad/opad key schedule
+_AUTH_HMAC = None
+
+def _get_auth_key():
+    """Resolve AUTH_KEY (and its keyed HMAC) once, outside of module import."""
+    global AUTH_KEY, _AUTH_HMAC
+    if AUTH_KEY is None:
+        AUTH_KEY = _load_ipc_auth_key()
+        _AUTH_HMAC = hmac.new(AUTH_KEY, digestmod='sha256')
+    return AUTH_KEY
 
 def compute_auth_response(challenge: str, auth_key: bytes) -> str:
     """Compute HMAC-SHA256 response to a challenge."""
-    h = hmac.new(auth_key, challenge.encode('utf-8'), hashlib.sha256)
-    return h.hexdigest()
+    if _AUTH_HMAC is not None and auth_key == AUTH_KEY:
+        h = _AUTH_HMAC.copy()
+        h.update(challenge.encode('utf-8'))
+        return h.hexdigest()
+    # Other keys: one-shot C implementation, no intermediate HMAC object
+    return hmac.digest(auth_key, challenge.encode('utf-8'), 'sha256').hex()
 
 # Setup logging
 try:
@@ -59,12 +115,22 @@ except ImportError:
     # Fallback if run standalone or path issues
     log_dir = os.path.join(os.path.expanduser('~'), 'Documents', 'Insta Outreach Logger', 'logs')
 
-os.makedirs(log_dir, exist_ok=True)
-logging.basicConfig(
-    filename=os.path.join(log_dir, 'bridge.log'),
-    level=logging.INFO,
-    format='%(asctime)s - %(levelname)s - %(message)s'
-)
+def _setup_logging():
+    """
+    Send log records to bridge.log via a background thread, so the message
+    loop never waits on file I/O. Called from main() rather than at import.
+    """
+    os.makedirs(log_dir, exist_ok=True)
+    handler = logging.FileHandler(os.path.join(log_dir, 'bridge.log'))
+    handler.setFormatter(logging.Formatter('%(asctime)s - %(levelname)s - %(message)s'))
+    log_queue = queue.SimpleQueue()
+    listener = logging.handlers.QueueListener(log_queue, handler)
+    listener.start()
+    # Drain queued records at exit
+    atexit.register(listener.stop)
+    root_logger = logging.getLogger()
+    root_logger.addHandler(logging.handlers.QueueHandler(log_queue))
+    root_logger.setLevel(logging.INFO)
 
 def send_native_message(message_content):
     """
@@ -72,9 +138,9 @@ def send_native_message(message_content):
     Format: [4 bytes length (little endian)][JSON string]
     """
     try:
-        encoded_content = json.dumps(message_content).encode('utf-8')
-        sys.stdout.buffer.write(struct.pack('I', len(encoded_content)))
-        sys.stdout.buffer.write(encoded_content)
+        encoded_content = _dumps(message_content)
+        # One write per frame (header + payload) so each message is a single WriteFile
+        sys.stdout.buffer.write(_HDR_NATIVE.pack(len(encoded_content)) + encoded_content)
         sys.stdout.buffer.flush()
     except Exception as e:
         logging.error(f"Failed to send native message: {e}")
@@ -85,36 +151,59 @@ def read_native_message():
     Format: [4 bytes length][JSON string]
     """
     try:
-        text_length_bytes = sys.stdin.buffer.read(4)
-        if not text_length_bytes:
+        header = _STDIN_BUF[:_HDR_SIZE]
+        if sys.stdin.buffer.readinto(header) < _HDR_SIZE:
             return None
-        text_length = struct.unpack('i', text_length_bytes)[0]
+        text_length = _HDR_NATIVE.unpack(header)[0]
         
         if text_length > MAX_MSG_SIZE:
             logging.error(f"Message too large: {text_length}")
             return None
             
-        text = sys.stdin.buffer.read(text_length).decode('utf-8')
-        return json.loads(text)
+        payload = _STDIN_BUF[:text_length]
+        if sys.stdin.buffer.readinto(payload) < text_length:
+            logging.error("Stdin closed mid-message")
+            return None
+        return _loads(payload)
     except Exception as e:
         logging.error(f"Failed to read native message: {e}")
         return None
 
+def _recv_exact(sock, n, buf=_IPC_BUF):
+    """
+    Read exactly n bytes (TCP recv may return fewer than requested) into the
+    shared buffer. The returned view is only valid until the next call.
+    """
+    got = 0
+    while got < n:
+        received = sock.recv_into(buf[got:n])
+        if not received:
+            raise ConnectionResetError("Server closed connection")
+        got += received
+    return buf[:n]
+
+def _recv_ipc_message(sock):
+    """Read one length-prefixed JSON message from the IPC server."""
+    length = _HDR_BE.unpack(_recv_exact(sock, _HDR_SIZE))[0]
+    if length > MAX_MSG_SIZE:
+        # Stream is out of sync or hostile; drop the connection
+        raise ConnectionResetError(f"IPC message too large: {length}")
+    return _loads(_recv_exact(sock, length))
+
 def connect_to_ipc_server():
     """Establishes connection to the local Python IPC Server with enhanced authentication."""
     try:
         s = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        # Messages are small request/response pairs; don't let Nagle hold them back
+        s.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        # Room for a full MAX_MSG_SIZE frame in either direction (set before
+        # connect so the window is negotiated with it)
+        s.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, MAX_MSG_SIZE)
+        s.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, MAX_MSG_SIZE)
         s.connect(('127.0.0.1', PORT))
         
         # 1. Receive challenge from server
-        header = s.recv(4)
-        if not header:
-            logging.error("No challenge received from server")
-            return None
-        
-        length = struct.unpack('>I', header)[0]
-        challenge_bytes = s.recv(length)
-        challenge_msg = json.loads(challenge_bytes.decode('utf-8'))
+        challenge_msg = _recv_ipc_message(s)
         
         if challenge_msg.get('action') != 'challenge':
             logging.error(f"Expected challenge, got: {challenge_msg}")
@@ -124,25 +213,17 @@ def connect_to_ipc_server():
         logging.info("Received authentication challenge")
         
         # 2. Compute and send response
-        response = compute_auth_response(challenge, AUTH_KEY)
+        response = compute_auth_response(challenge, _get_auth_key())
         auth_msg = {
             "action": "auth",
             "response": response
         }
         
-        msg_bytes = json.dumps(auth_msg).encode('utf-8')
-        s.sendall(struct.pack('>I', len(msg_bytes)))
-        s.sendall(msg_bytes)
+        msg_bytes = _dumps(auth_msg)
+        s.sendall(_HDR_BE.pack(len(msg_bytes)) + msg_bytes)
         
         # 3. Read authentication result
-        header = s.recv(4)
-        if not header:
-            logging.error("No auth response from server")
-            return None
-        
-        length = struct.unpack('>I', header)[0]
-        resp_bytes = s.recv(length)
-        resp = json.loads(resp_bytes.decode('utf-8'))
+        resp = _recv_ipc_message(s)
         
         if resp.get('success'):
             logging.info("Authentication successful")
@@ -155,12 +236,45 @@ def connect_to_ipc_server():
         logging.error(f"Could not connect to IPC Server: {e}")
         return None
 
+def _is_push(msg):
+    return isinstance(msg, dict) and msg.get('type') in _PUSH_TYPES and 'requestId' not in msg
+
+def _forward_pushed_messages(sock, selector):
+    """
+    Relay messages the server sent on its own (e.g. SYNC_COMPLETED broadcasts)
+    to Chrome while the bridge was idle on stdin.
+    """
+    while selector.select(timeout=0):
+        pushed = _recv_ipc_message(sock)
+        logging.info(f"Pushed from IPC: {pushed}")
+        send_native_message(pushed)
+
+def _recv_ipc_response(sock, selector):
+    """
+    Wait for the reply to a forwarded message, relaying any broadcast that
+    arrives first. Without this a push would be taken as the reply and every
+    later reply would be off by one.
+    """
+    while True:
+        # A hung backend drops the connection instead of blocking the bridge forever
+        if not selector.select(timeout=IPC_RESPONSE_TIMEOUT):
+            raise TimeoutError("No response from IPC server")
+        msg = _recv_ipc_message(sock)
+        if not _is_push(msg):
+            return msg
+        logging.info(f"Pushed from IPC: {msg}")
+        send_native_message(msg)
+
 def main():
+    _setup_logging()
     logging.info("Bridge started.")
+    auth_key = _get_auth_key()
     logging.info(f"ENV loaded: {_ENV_LOADED}, ENV path: {_ENV_PATH}")
-    logging.info(f"AUTH_KEY length: {len(AUTH_KEY)}, first 8 chars: {AUTH_KEY[:8]}")
+    logging.info(f"AUTH_KEY length: {len(auth_key)}, first 8 chars: {auth_key[:8]}")
     
     ipc_socket = None
+    # Readiness of ipc_socket (epoll/kqueue/select depending on the platform)
+    ipc_selector = selectors.DefaultSelector()
 
     while True:
         # 1. Read from Chrome (Blocking)
@@ -175,6 +289,8 @@ def main():
         if not ipc_socket:
             logging.info("Connecting to IPC Server...")
             ipc_socket = connect_to_ipc_server()
+            if ipc_socket:
+                ipc_selector.register(ipc_socket, selectors.EVENT_READ)
         
         if not ipc_socket:
             logging.error("Backend offline. Cannot forward message.")
@@ -183,24 +299,21 @@ def main():
 
         # 3. Forward to IPC
         try:
-            msg_bytes = json.dumps(message).encode('utf-8')
-            ipc_socket.sendall(struct.pack('>I', len(msg_bytes)))
-            ipc_socket.sendall(msg_bytes)
+            _forward_pushed_messages(ipc_socket, ipc_selector)
+            
+            msg_bytes = _dumps(message)
+            # Header and body in one sendall: one syscall, one TCP segment
+            ipc_socket.sendall(_HDR_BE.pack(len(msg_bytes)) + msg_bytes)
             
             # 4. Read Response
-            header = ipc_socket.recv(4)
-            if not header:
-                raise ConnectionResetError("Server closed connection")
-                
-            length = struct.unpack('>I', header)[0]
-            resp_bytes = ipc_socket.recv(length)
-            response = json.loads(resp_bytes.decode('utf-8'))
+            response = _recv_ipc_response(ipc_socket, ipc_selector)
             
             logging.info(f"Response from IPC: {response}")
             send_native_message(response)
             
         except (ConnectionResetError, BrokenPipeError, socket.error) as e:
             logging.error(f"IPC Connection lost: {e}")
+            ipc_selector.unregister(ipc_socket)
             ipc_socket.close()
             ipc_socket = None
             # Retry logic could be added here, but for now we inform the user
@@ -9,9 +9,65 @@ import os
 import json
 from typing import Any, Optional, Dict
 from pathlib import Path
+from types import MappingProxyType
 import sys
 
 
+_DOCUMENTS_DIR = os.path.join(os.path.expanduser('~'), 'Documents')
+_APP_DIR_NAME = 'Insta Outreach Logger'
+
+# Default values, built once at import (read-only; Config copies them)
+_DEFAULTS = MappingProxyType({
+    # Application
+    'app_name': 'Insta Outreach Logger (Remastered)',
+    'app_version': '1.0.0',
+    
+    # IPC Configuration
+    'ipc_port': 65432,
+    'ipc_host': '127.0.0.1',
+    'ipc_max_message_size': 1048576,  # 1MB
+    'ipc_timeout': 10.0,
+    
+    # Security
+    'max_auth_attempts': 5,
+    'auth_window_seconds': 300,
+    'token_expiry_days': 30,
+    
+    # Database
+    'db_path': None,  # Will be set based on PROJECT_ROOT
+    'db_backup_enabled': True,
+    'db_backup_interval_hours': 24,
+    
+    # Sync
+    'sync_interval_seconds': 60,
+    'sync_batch_size': 100,
+    'sync_retry_attempts': 3,
+    
+    # Logging
+    'log_level': 'INFO',
+    'log_file_max_bytes': 10485760,  # 10MB
+    'log_backup_count': 5,
+    
+    # GitHub
+    'github_owner': 'hashaam101',
+    'github_repo': 'Insta-Outreach-Logger-Remastered',
+    
+    # Paths
+    'documents_dir': _DOCUMENTS_DIR,
+    'app_dir_name': _APP_DIR_NAME,
+    'log_dir': os.path.join(_DOCUMENTS_DIR, _APP_DIR_NAME, 'logs'),
+})
+
+# Environment overrides: (variable, config key, cast)
+_ENV_MAP = (
+    ('IOL_MASTER_SECRET', 'master_secret', str),
+    ('IOL_IPC_AUTH_KEY', 'ipc_auth_key', str),
+    ('IOL_IPC_PORT', 'ipc_port', int),
+    ('IOL_LOG_LEVEL', 'log_level', str),
+    ('IOL_SYNC_INTERVAL', 'sync_interval_seconds', int),
+)
+
+
 class ConfigurationError(Exception):
     """Raised when configuration is invalid or missing."""
     pass
@@ -45,52 +101,8 @@ class Config:
     
     def _load_defaults(self):
         """Load default configuration values."""
-        self._config = {
-            # Application
-            'app_name': 'Insta Outreach Logger (Remastered)',
-            'app_version': '1.0.0',
-            
-            # IPC Configuration
-            'ipc_port': 65432,
-            'ipc_host': '127.0.0.1',
-            'ipc_max_message_size': 1048576,  # 1MB
-            'ipc_timeout': 10.0,
-            
-            # Security
-            'max_auth_attempts': 5,
-            'auth_window_seconds': 300,
-            'token_expiry_days': 30,
-            
-            # Database
-            'db_path': None,  # Will be set based on PROJECT_ROOT
-            'db_backup_enabled': True,
-            'db_backup_interval_hours': 24,
-            
-            # Sync
-            'sync_interval_seconds': 60,
-            'sync_batch_size': 100,
-            'sync_retry_attempts': 3,
-            
-            # Logging
-            'log_level': 'INFO',
-            'log_file_max_bytes': 10485760,  # 10MB
-            'log_backup_count': 5,
-            
-            # GitHub
-            'github_owner': 'hashaam101',
-            'github_repo': 'Insta-Outreach-Logger-Remastered',
-            
-            # Paths
-            'documents_dir': os.path.join(os.path.expanduser('~'), 'Documents'),
-            'app_dir_name': 'Insta Outreach Logger',
-        }
-        
-        # Set derived paths
-        self._config['log_dir'] = os.path.join(
-            self._config['documents_dir'],
-            self._config['app_dir_name'],
-            'logs'
-        )
+        # Shallow copy is enough: every default is an immutable scalar
+        self._config = dict(_DEFAULTS)
     
     def _load_from_file(self, config_file: str):
         """
@@ -108,22 +120,11 @@ class Config:
     
     def _load_from_env(self):
         """Load configuration from environment variables."""
-        # Security keys (critical)
-        if 'IOL_MASTER_SECRET' in os.environ:
-            self._config['master_secret'] = os.environ['IOL_MASTER_SECRET']
-        
-        if 'IOL_IPC_AUTH_KEY' in os.environ:
-            self._config['ipc_auth_key'] = os.environ['IOL_IPC_AUTH_KEY']
-        
-        # Optional overrides
-        if 'IOL_IPC_PORT' in os.environ:
-            self._config['ipc_port'] = int(os.environ['IOL_IPC_PORT'])
-        
-        if 'IOL_LOG_LEVEL' in os.environ:
-            self._config['log_level'] = os.environ['IOL_LOG_LEVEL']
-        
-        if 'IOL_SYNC_INTERVAL' in os.environ:
-            self._config['sync_interval_seconds'] = int(os.environ['IOL_SYNC_INTERVAL'])
+        # Security keys (critical) and optional overrides
+        for env_key, config_key, cast in _ENV_MAP:
+            value = os.environ.get(env_key)
+            if value is not None:
+                self._config[config_key] = cast(value)
     
     def _validate(self):
         """Validate configuration values."""
@@ -1,8 +1,38 @@
-import re
 import logging
+import threading
+import time
+from collections import OrderedDict
+try:
+    # RE2 matches in linear time (no backtracking blowups on scraped HTML text)
+    import re2 as re
+except ImportError:
+    import re
 import requests
-from bs4 import BeautifulSoup
-from urllib.parse import unquote, urlparse, parse_qs
+from requests.adapters import HTTPAdapter
+from bs4 import BeautifulSoup, SoupStrainer
+from urllib.parse import unquote, unquote_plus
+
+try:
+    import lxml.html  # C parser; also used directly (XPath, text_content) below
+    from lxml import etree
+    HTML_PARSER = 'lxml'
+except ImportError:
+    HTML_PARSER = 'html.parser'
+
+def _class_xpath(class_name: str, prefix: str = '//') -> str:
+    """XPath equivalent of the CSS class selector '.class_name'."""
+    return f"{prefix}*[contains(concat(' ', normalize-space(@class), ' '), ' {class_name} ')]"
+
+if HTML_PARSER == 'lxml':
+    # DuckDuckGo result selectors, compiled once (same as CSSSelector does
+    # internally, without needing the cssselect package)
+    _SEL_RESULT = etree.XPath(_class_xpath('result'))
+    _SEL_TITLE = etree.XPath(_class_xpath('result__title', './/'))
+    _SEL_SNIPPET = etree.XPath(_class_xpath('result__snippet', './/'))
+
+# Only the page body (and any stray anchors) matter for contact scraping;
+# <head> scripts/styles/meta are never built into the tree (bs4 fallback).
+_CONTACT_STRAINER = SoupStrainer(['a', 'body'])
 
 class ContactDiscoverer:
     """
@@ -18,21 +48,70 @@ class ContactDiscoverer:
     # Excludes 0xx/1xx area codes and exchanges.
     PHONE_REGEX = re.compile(r'(?:\+?1[-. ]?)?\(?([2-9]\d{2})\)?[-. ]?([2-9]\d{2})[-. ]?(\d{4})')
 
+    # Bio-link pages are read up to this many bytes; contact details live in
+    # normal-sized HTML, so anything past 1 MiB is not worth downloading/parsing.
+    MAX_PAGE_BYTES = 1024 * 1024
+
+    # Discovery result cache (LRU with expiry)
+    CACHE_SIZE = 1024
+    CACHE_TTL = 3600  # seconds
+
     def __init__(self):
         self.logger = logging.getLogger(__name__)
 
+        # Pooled keep-alive connections, shared by the crawl and the search
+        self._session = requests.Session()
+        self._session.headers.update({'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64)'})
+        # No retries: a dead bio-link host should cost one timeout, and
+        # DuckDuckGo rate-limits repeat requests hard
+        adapter = HTTPAdapter(pool_connections=32, pool_maxsize=32, max_retries=0)
+        self._session.mount('https://', adapter)
+        self._session.mount('http://', adapter)
+
+        # (kind, url/query) -> (timestamp, result); bulk runs hit the same
+        # link hubs and names repeatedly
+        self._cache = OrderedDict()
+        self._cache_lock = threading.Lock()
+
+    def _cache_get(self, key):
+        """Returns (hit, result) for a cached lookup younger than CACHE_TTL."""
+        with self._cache_lock:
+            entry = self._cache.get(key)
+            if entry is None:
+                return False, None
+            if time.monotonic() - entry[0] > self.CACHE_TTL:
+                del self._cache[key]
+                return False, None
+            self._cache.move_to_end(key)
+            return True, entry[1]
+
+    def _cache_put(self, key, result):
+        with self._cache_lock:
+            self._cache[key] = (time.monotonic(), result)
+            self._cache.move_to_end(key)
+            if len(self._cache) > self.CACHE_SIZE:
+                self._cache.popitem(last=False)
+
     def _clean_instagram_url(self, url: str) -> str:
         """Decodes l.instagram.com redirect links to get the real URL."""
-        if not url: return url
-        if 'l.instagram.com' in url:
-            try:
-                parsed = urlparse(url)
-                qs = parse_qs(parsed.query)
-                if 'u' in qs:
-                    return unquote(qs['u'][0])
-            except Exception:
-                pass
-        return url
+        if not url or 'l.instagram.com' not in url:
+            return url
+        # Only the 'u' parameter matters, so slice it out directly instead
+        # of building the full urlparse/parse_qs structures. The query is
+        # everything between the first '?' and the fragment's '#'.
+        base = url.split('#', 1)[0]
+        q = base.find('?')
+        if q < 0:
+            return url
+        query = '&' + base[q + 1:]
+        start = query.find('&u=')
+        if start < 0:
+            return url
+        value = query[start + 3:].split('&', 1)[0]
+        if not value:
+            return url
+        # Same decoding as before: parse_qs (unquote_plus), then unquote
+        return unquote(unquote_plus(value))
     
     def _validate_phone(self, phone_text: str) -> str:
         """
@@ -47,69 +126,116 @@ class ContactDiscoverer:
         area, exchange, subscriber = match.groups()
         return f"({area}) {exchange}-{subscriber}"
 
+    def _scan_contacts(self, text: str, email: str = None) -> tuple:
+        """
+        Finds the first email and first phone number in text.
+        An email that is already known is kept. Returns (email, formatted phone or None).
+        """
+        # Separate searches on purpose: in a single alternation the email
+        # branch would swallow digits such as "2125551234@mail.com".
+        # Cheap substring prefilters (memchr-speed) skip a pattern that cannot
+        # match at all; an email needs '@', a phone needs a digit 2-9.
+        if not email and '@' in text:
+            match = self.EMAIL_REGEX.search(text)
+            if match:
+                email = match.group(0)
+        phone = None
+        if any(d in text for d in '23456789'):
+            match = self.PHONE_REGEX.search(text)
+            if match:
+                phone = "({}) {}-{}".format(*match.groups())
+        return email, phone
+
     def extract_from_website(self, url: str) -> dict:
         """
         Visits the website and crawls for mailto: links, tel: links, 
         or Contact Us pages to find emails and phone numbers.
+        Results are cached per cleaned URL (failed requests are not).
         
         Returns:
             dict: {'email': str, 'phone_number': str, 'source': str} or None
         """
         clean_url = self._clean_instagram_url(url)
-        try:
-            # print(f"[Discovery] Crawling website: {clean_url}") 
-            response = requests.get(clean_url, timeout=10, headers={'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64)'})
+        cache_key = ('website', clean_url)
+        hit, res = self._cache_get(cache_key)
+        if not hit:
+            try:
+                res = self._fetch_and_parse(clean_url)
+            except Exception as e:
+                self.logger.warning(f"Failed to extract from website {url}: {e}")
+                return None
+            self._cache_put(cache_key, res)
+        # Callers may update the result (e.g. bio phone), so hand out a copy
+        return dict(res) if res else None
+
+    def _fetch_and_parse(self, clean_url: str) -> dict:
+        """Downloads one page and scrapes it. Raises on network/HTTP errors."""
+        # print(f"[Discovery] Crawling website: {clean_url}") 
+        with self._session.get(clean_url, timeout=10, stream=True) as response:
             response.raise_for_status()
             
-            soup = BeautifulSoup(response.text, 'html.parser')
-            
-            email = None
-            phone = None
+            content_type = response.headers.get('Content-Type', '')
+            if content_type and not content_type.startswith(('text/html', 'application/xhtml')):
+                print(f"[Discovery] Website Scraping: Skipping non-HTML content ({content_type}) on {clean_url}")
+                return None
             
-            # 1. Check mailto: links
+            body = response.raw.read(self.MAX_PAGE_BYTES, decode_content=True)
+        
+        if not body.strip():
+            print(f"[Discovery] Website Scraping: No info found on {clean_url}")
+            return None
+        
+        # Raw bytes: the parser detects the encoding itself
+        if HTML_PARSER == 'lxml':
+            # lxml directly: XPath and text_content() run in C, no bs4 tree walk
+            doc = lxml.html.document_fromstring(body)
+            mailto_hrefs = doc.xpath('//a[starts-with(@href, "mailto:")]/@href')
+            href = mailto_hrefs[0] if mailto_hrefs else None
+            text_root = doc.body if doc.body is not None else doc
+            text_content = text_root.text_content()
+        else:
+            soup = BeautifulSoup(body, HTML_PARSER, parse_only=_CONTACT_STRAINER)
             mailto = soup.select_one('a[href^="mailto:"]')
-            if mailto:
-                href = mailto.get('href')
-                if href:
-                    email_match = self.EMAIL_REGEX.search(href)
-                    if email_match:
-                        email = email_match.group(0)
-                        
-            # 2. Check text for regex matches if not found
+            href = mailto.get('href') if mailto else None
             text_content = soup.get_text()
+        
+        email = None
+        phone = None
+        
+        # 1. Check mailto: links
+        if href:
+            email_match = self.EMAIL_REGEX.search(href)
+            if email_match:
+                email = email_match.group(0)
+                    
+        # 2. Check text for regex matches if not found
+        email, phone = self._scan_contacts(text_content, email)
             
-            if not email:
-                email_match = self.EMAIL_REGEX.search(text_content)
-                if email_match:
-                    email = email_match.group(0)
-            
-            phone_raw = self.PHONE_REGEX.search(text_content)
-            if phone_raw:
-                phone = self._validate_phone(phone_raw.group(0))
-                
-            if email or phone:
-                res = {
-                    'email': email,
-                    'phone_number': phone,
-                    'source': f'Website ({clean_url})'
-                }
-                print(f"[Discovery] Website Scraping Result for {clean_url}: {res}")
-                return res
-            else:
-                print(f"[Discovery] Website Scraping: No info found on {clean_url}")
-                
-        except Exception as e:
-            self.logger.warning(f"Failed to extract from website {url}: {e}")
-            
+        if email or phone:
+            res = {
+                'email': email,
+                'phone_number': phone,
+                'source': f'Website ({clean_url})'
+            }
+            print(f"[Discovery] Website Scraping Result for {clean_url}: {res}")
+            return res
+        
+        print(f"[Discovery] Website Scraping: No info found on {clean_url}")
         return None
 
     def search_duckduckgo(self, query: str) -> dict:
         """
         Initiates a headless DuckDuckGo search and parses snippets.
+        Results are cached per query (empty/failed searches are not).
         
         Returns:
             dict: {'email': str, 'phone_number': str, 'source': str} or None
         """
+        cache_key = ('search', query)
+        hit, res = self._cache_get(cache_key)
+        if hit:
+            return dict(res) if res else None
+
         try:
             print(f"[Discovery] Searching DuckDuckGo for: '{query}'")
             results = self._perform_search(query)
@@ -117,11 +243,7 @@ class ContactDiscoverer:
             for result in results:
                 text = result.get('body', '') + " " + result.get('title', '')
                 
-                email_match = self.EMAIL_REGEX.search(text)
-                phone_raw = self.PHONE_REGEX.search(text)
-                
-                email = email_match.group(0) if email_match else None
-                phone = self._validate_phone(phone_raw.group(0)) if phone_raw else None
+                email, phone = self._scan_contacts(text)
                 
                 if email or phone:
                     res = {
@@ -130,9 +252,12 @@ class ContactDiscoverer:
                         'source': 'DuckDuckGo'
                     }
                     print(f"[Discovery] Search Result Found: {res}")
-                    return res
+                    self._cache_put(cache_key, res)
+                    return dict(res)
             
             print(f"[Discovery] Search complete. No contact info found in snippets.")
+            if results:
+                self._cache_put(cache_key, None)
                     
         except Exception as e:
             self.logger.warning(f"Search failed for query '{query}': {e}")
@@ -147,12 +272,24 @@ class ContactDiscoverer:
         """
         try:
             url = 'https://html.duckduckgo.com/html/'
-            response = requests.post(url, data={'q': query}, headers={'User-Agent': 'Mozilla/5.0'})
+            response = self._session.post(url, data={'q': query}, headers={'User-Agent': 'Mozilla/5.0'}, timeout=10)
             response.raise_for_status()
             
-            soup = BeautifulSoup(response.text, 'html.parser')
             results = []
+            if HTML_PARSER == 'lxml':
+                doc = lxml.html.document_fromstring(response.content)
+                for result in _SEL_RESULT(doc):
+                    title_elems = _SEL_TITLE(result)
+                    snippet_elems = _SEL_SNIPPET(result)
+                    
+                    if title_elems and snippet_elems:
+                        results.append({
+                            'title': title_elems[0].text_content().strip(),
+                            'body': snippet_elems[0].text_content().strip()
+                        })
+                return results
             
+            soup = BeautifulSoup(response.text, 'html.parser')
             for result in soup.select('.result'):
                 title_elem = result.select_one('.result__title')
                 snippet_elem = result.select_one('.result__snippet')
@@ -200,7 +337,9 @@ class ContactDiscoverer:
                     else:
                         website_result = {'email': None, 'phone_number': found_phone, 'source': 'Instagram Bio'}
 
-        # Fallback to search
+        # Fallback to search. Deliberately not started alongside the crawl:
+        # DuckDuckGo rate-limits hard, so only query it when the bio link
+        # did not already give both email and phone.
         # Support both 'name' (from prompt) and 'target_username' (from test/existing code)
         name = profile_data.get('name', profile_data.get('target_username', ''))
         address = profile_data.get('address', '')
@@ -1,7 +1,9 @@
 import oracledb
 import os
 import sys
-import pandas as pd
+import threading
+import time
+from contextlib import contextmanager
 from datetime import datetime
 from dotenv import load_dotenv
 
@@ -21,7 +23,18 @@ HAS_CONFIG = all([
     os.getenv('DB_DSN')
 ])
 
+# Columns the local rules/goals caches consume (see LocalDatabase.update_*_cache)
+RULE_COLUMNS = ('RULE_ID', 'TYPE', 'METRIC', 'LIMIT_VALUE', 'TIME_WINDOW_SEC', 'SEVERITY',
+                'ASSIGNED_TO_OPR', 'ASSIGNED_TO_ACT', 'STATUS')
+GOAL_COLUMNS = ('GOAL_ID', 'METRIC', 'TARGET_VALUE', 'FREQUENCY', 'ASSIGNED_TO_OPR',
+                'ASSIGNED_TO_ACT', 'STATUS', 'SUGGESTED_BY', 'START_DATE', 'END_DATE')
+
 class DatabaseManager:
+    # Rows per round-trip for potentially large TARGETS pulls.
+    FETCH_ARRAYSIZE = 1000
+    # Rows per executemany() call when pushing event batches.
+    DML_BATCH_SIZE = 500
+
     def __init__(self):
         if not HAS_CONFIG:
             raise ImportError("Database configuration (.env file) not found or incomplete.")
@@ -38,11 +51,66 @@ class DatabaseManager:
             max=5,
             increment=1,
             getmode=oracledb.POOL_GETMODE_WAIT,
-            timeout=10
+            timeout=10,
+            # Heartbeats, governance pulls and event pushes re-run the same
+            # handful of statements every cycle; keep them parsed per session.
+            stmtcachesize=40
         )
+        self._local = threading.local()  # .conn: connection held by session() on this thread
+        self._known_actors = set()  # (actor_username, operator_name) already in ACTORS
+        self._known_actors_lock = threading.Lock()
+        self._last_id_ms = 0
+        self._id_lock = threading.Lock()
+
+    def _new_id(self, prefix):
+        """Millisecond-based ID (e.g. ELG-18D...) that never repeats within this process."""
+        with self._id_lock:
+            ms = max(int(time.time() * 1000), self._last_id_ms + 1)
+            self._last_id_ms = ms
+        return f"{prefix}-{ms:X}"
+
+    @contextmanager
+    def session(self):
+        """
+        Holds one pooled connection for this thread so every DatabaseManager
+        call inside the block reuses it instead of acquiring its own.
+        Commits on a clean exit; nested sessions join the outer one.
+        """
+        if getattr(self._local, 'conn', None) is not None:
+            yield self._local.conn
+            return
+        with self.pool.acquire() as connection:
+            self._local.conn = connection
+            try:
+                yield connection
+                connection.commit()
+            finally:
+                self._local.conn = None
+
+    @contextmanager
+    def _shared_connection(self, connection):
+        # A failed call must not leave half-done DML for the session to commit
+        try:
+            yield connection
+        except BaseException:
+            try:
+                connection.rollback()
+            except oracledb.Error:
+                pass  # Connection is gone; the original error says why
+            raise
+
+    def _commit_unless_session(self, connection):
+        """Commits now outside session(); inside one, leaves it to the session. Returns True if committed."""
+        if getattr(self._local, 'conn', None) is not None:
+            return False
+        connection.commit()
+        return True
 
     def get_connection(self):
-        return self.pool.acquire()
+        connection = getattr(self._local, 'conn', None)
+        if connection is None:
+            return self.pool.acquire()
+        return self._shared_connection(connection)
 
     def get_operator_by_email(self, email):
         """
@@ -84,49 +152,78 @@ class DatabaseManager:
         """
         Checks if an actor is registered to this operator.
         If not, registers it according to the shared ownership model.
+        One lookup resolves the operator and the pair together; the insert
+        only runs for a new pair. Pairs confirmed in ACTORS are remembered,
+        so repeat calls skip the database.
         """
+        key = (actor_username, operator_name)
+        with self._known_actors_lock:
+            if key in self._known_actors:
+                return
         with self.get_connection() as connection:
             with connection.cursor() as cursor:
-                # 1. Resolve OPR_ID
-                cursor.execute("SELECT OPR_ID FROM OPERATORS WHERE OPR_NAME = :1", [operator_name])
+                # 1. Resolve OPR_ID and whether this Actor + Operator pair exists
+                cursor.execute("""
+                    SELECT o.OPR_ID,
+                           (SELECT COUNT(*) FROM ACTORS a WHERE a.ACT_USERNAME = :1 AND a.OPR_ID = o.OPR_ID)
+                    FROM OPERATORS o WHERE o.OPR_NAME = :2
+                """, [actor_username, operator_name])
                 res = cursor.fetchone()
                 if not res:
                     print(f"[OracleDB] Error: Operator '{operator_name}' not found in DB.")
                     return
-                opr_id = res[0]
-
-                # 2. Check if this specific pair (Actor + Operator) exists
-                cursor.execute(
-                    "SELECT COUNT(*) FROM ACTORS WHERE ACT_USERNAME = :1 AND OPR_ID = :2", 
-                    [actor_username, opr_id]
-                )
-                exists = cursor.fetchone()[0] > 0
-                
+                opr_id, exists = res
+
+                # 2. Register it (MERGE so a concurrent registration isn't duplicated)
                 if not exists:
-                    print(f"[OracleDB] Registering actor '@{actor_username}' for operator '{operator_name}'...")
-                    import time
+                    # Seconds-based ACT-XXXXXXXX, the format documented in schema.dbml
                     act_id = f"ACT-{int(time.time()):X}"
                     cursor.execute("""
-                        INSERT INTO ACTORS (ACT_ID, ACT_USERNAME, OPR_ID, ACT_STATUS, CREATED_AT, LAST_ACTIVITY)
-                        VALUES (:1, :2, :3, 'Active', SYSTIMESTAMP, SYSTIMESTAMP)
+                        MERGE INTO ACTORS a
+                        USING (SELECT :1 AS ACT_ID, :2 AS ACT_USERNAME, :3 AS OPR_ID FROM DUAL) s
+                        ON (a.ACT_USERNAME = s.ACT_USERNAME AND a.OPR_ID = s.OPR_ID)
+                        WHEN NOT MATCHED THEN
+                            INSERT (ACT_ID, ACT_USERNAME, OPR_ID, ACT_STATUS, CREATED_AT, LAST_ACTIVITY)
+                            VALUES (s.ACT_ID, s.ACT_USERNAME, s.OPR_ID, 'Active', SYSTIMESTAMP, SYSTIMESTAMP)
                     """, [act_id, actor_username, opr_id])
-                    connection.commit()
+                    if cursor.rowcount:
+                        print(f"[OracleDB] Registered actor '@{actor_username}' for operator '{operator_name}'.")
+                        if not self._commit_unless_session(connection):
+                            return  # Remember it once the session has committed
+        with self._known_actors_lock:
+            self._known_actors.add(key)
 
-    def fetch_prospects_updates(self, since_timestamp=None):
+    def fetch_prospects_updates(self, since_timestamp=None, limit=None, after_tar_id=None):
+        """
+        Fetches TARGETS changed after since_timestamp (all rows if None).
+        With limit, returns at most that many rows ordered by (LAST_UPDATED, TAR_ID);
+        pass the last row's last_updated and tar_id back in for the next page.
+        """
+        sql = "SELECT TAR_ID, TAR_USERNAME, TAR_STATUS, NOTES, LAST_UPDATED, FIRST_CONTACTED, EMAIL, PHONE_NUM, CONT_SOURCE FROM TARGETS"
+        params = {}
         if since_timestamp:
-            sql = "SELECT TAR_ID, TAR_USERNAME, TAR_STATUS, NOTES, LAST_UPDATED, FIRST_CONTACTED, EMAIL, PHONE_NUM, CONT_SOURCE FROM TARGETS WHERE LAST_UPDATED > :1"
             if isinstance(since_timestamp, str):
-                try: since_timestamp = pd.to_datetime(since_timestamp)
-                except: pass
-            params = [since_timestamp]
-        else:
-            sql = "SELECT TAR_ID, TAR_USERNAME, TAR_STATUS, NOTES, LAST_UPDATED, FIRST_CONTACTED, EMAIL, PHONE_NUM, CONT_SOURCE FROM TARGETS"
-            params = []
+                # ISO strings from SQLite; fromisoformat only accepts a trailing Z on 3.11+
+                try: since_timestamp = datetime.fromisoformat(since_timestamp.replace('Z', '+00:00'))
+                except ValueError: pass
+            params['ts'] = since_timestamp
+            if after_tar_id:
+                # Keyset: rows sharing the boundary timestamp are not skipped
+                sql += " WHERE (LAST_UPDATED > :ts OR (LAST_UPDATED = :ts AND TAR_ID > :tar_id))"
+                params['tar_id'] = after_tar_id
+            else:
+                sql += " WHERE LAST_UPDATED > :ts"
+        if limit:
+            sql += " ORDER BY LAST_UPDATED, TAR_ID FETCH FIRST :lim ROWS ONLY"
+            params['lim'] = limit
 
         with self.get_connection() as connection:
             with connection.cursor() as cursor:
+                # Fetch in large batches and consume the cursor directly so the
+                # full result never sits in memory twice (tuples + dicts).
+                cursor.arraysize = self.FETCH_ARRAYSIZE
+                cursor.prefetchrows = self.FETCH_ARRAYSIZE + 1
                 cursor.execute(sql, params)
-                rows = cursor.fetchall()
                 return [
                     {
                         'tar_id': row[0],
@@ -139,25 +236,34 @@ class DatabaseManager:
                         'phone_number': row[7],
                         'source_summary': row[8]
                     }
-                    for row in rows
+                    for row in cursor
                 ]
 
     def fetch_active_rules(self):
-        sql = "SELECT * FROM RULES WHERE STATUS = 'Active'"
-        with self.get_connection() as connection:
-            with connection.cursor() as cursor:
-                cursor.execute(sql)
-                # Helper to map cursor description to dict
-                columns = [col[0] for col in cursor.description]
-                return [dict(zip(columns, row)) for row in cursor.fetchall()]
+        return self._fetch_active('RULES', RULE_COLUMNS)
 
     def fetch_active_goals(self):
-        sql = "SELECT * FROM GOALS WHERE STATUS = 'Active'"
+        return self._fetch_active('GOALS', GOAL_COLUMNS)
+
+    def _fetch_active(self, table, columns, cursor=None):
+        """Active rows of RULES/GOALS, projected to the given columns, as dicts."""
+        if cursor is None:
+            with self.get_connection() as connection:
+                with connection.cursor() as cursor:
+                    return self._fetch_active(table, columns, cursor)
+        cursor.execute(f"SELECT {', '.join(columns)} FROM {table} WHERE STATUS = 'Active'")
+        return [dict(zip(columns, row)) for row in cursor]
+
+    def fetch_governance_data(self):
+        """
+        Fetches active RULES and GOALS over a single pooled connection.
+        Returns (rules, goals) as lists of dicts.
+        """
         with self.get_connection() as connection:
             with connection.cursor() as cursor:
-                cursor.execute(sql)
-                columns = [col[0] for col in cursor.description]
-                return [dict(zip(columns, row)) for row in cursor.fetchall()]
+                rules = self._fetch_active('RULES', RULE_COLUMNS, cursor)
+                goals = self._fetch_active('GOALS', GOAL_COLUMNS, cursor)
+        return rules, goals
 
     def update_operator_heartbeat(self, operator_name):
         sql = "UPDATE OPERATORS SET LAST_ACTIVITY = SYSTIMESTAMP, OPR_STATUS = 'online' WHERE OPR_NAME = :1"
@@ -184,11 +290,14 @@ class DatabaseManager:
     def push_events_batch(self, events):
         """
         Bulk push local events to Oracle.
+        Targets are resolved per event; the log rows are then inserted with
+        chunked executemany() calls.
         Returns mapping of local_id -> {elg_id, tar_id}
         """
-        import time
         mapping = {}
-        
+        event_rows = []
+        outreach_rows = []
+
         with self.get_connection() as connection:
             with connection.cursor() as cursor:
                 for event in events:
@@ -208,14 +317,14 @@ class DatabaseManager:
                     if row:
                         tar_id = row[0]
                     else:
-                        tar_id = f"TAR-{int(time.time()*1000):X}" # Simple ID gen
+                        tar_id = self._new_id("TAR")
                         cursor.execute(
                             "INSERT INTO TARGETS (TAR_ID, TAR_USERNAME, TAR_STATUS, FIRST_CONTACTED, LAST_UPDATED) VALUES (:1, :2, 'Cold No Reply', SYSTIMESTAMP, SYSTIMESTAMP)",
                             [tar_id, tar_username]
                         )
                     
                     # 2. Insert Event Log
-                    elg_id = f"ELG-{int(time.time()*1000):X}"
+                    elg_id = self._new_id("ELG")
                     
                     # Resolve IDs from names if needed (simplified)
                     act_id = event['act_id']
@@ -257,14 +366,11 @@ class DatabaseManager:
                             # Always use Z regardless of input timezone
                             created_at_str = f"{base}.{frac}Z"
                     
-                    cursor.execute("""
-                        INSERT INTO EVENT_LOGS (ELG_ID, EVENT_TYPE, ACT_ID, OPR_ID, TAR_ID, DETAILS, CREATED_AT)
-                        VALUES (:1, :2, :3, :4, :5, :6, TO_TIMESTAMP(:7, 'YYYY-MM-DD"T"HH24:MI:SS.FF6"Z"'))
-                    """, [elg_id, event['event_type'], act_id, opr_id, tar_id, event['details'], created_at_str])
+                    event_rows.append((elg_id, event['event_type'], act_id, opr_id, tar_id, event['details'], created_at_str))
 
                     # 3. Insert Outreach Log (if applicable)
                     if event.get('message_text'):
-                        olg_id = f"OLG-{int(time.time()*1000):X}"
+                        olg_id = self._new_id("OLG")
                         
                         # Format sent_at timestamp
                         sent_at_str = event['sent_at']
@@ -286,16 +392,33 @@ class DatabaseManager:
                                 # Always use Z regardless of input timezone
                                 sent_at_str = f"{base}.{frac}Z"
                         
-                        cursor.execute("""
-                            INSERT INTO OUTREACH_LOGS (OLG_ID, ELG_ID, MESSAGE_TEXT, SENT_AT)
-                            VALUES (:1, :2, :3, TO_TIMESTAMP(:4, 'YYYY-MM-DD"T"HH24:MI:SS.FF6"Z"'))
-                        """, [olg_id, elg_id, event['message_text'], sent_at_str])
+                        outreach_rows.append((olg_id, elg_id, event['message_text'], sent_at_str))
 
                     mapping[event['id']] = {'elg_id': elg_id, 'tar_id': tar_id, 'target_username': tar_username}
-                
+
+                # 4. Bulk insert the logs (parents first: OUTREACH_LOGS references ELG_ID)
+                self._executemany_chunked(cursor, """
+                    INSERT INTO EVENT_LOGS (ELG_ID, EVENT_TYPE, ACT_ID, OPR_ID, TAR_ID, DETAILS, CREATED_AT)
+                    VALUES (:1, :2, :3, :4, :5, :6, TO_TIMESTAMP(:7, 'YYYY-MM-DD"T"HH24:MI:SS.FF6"Z"'))
+                """, event_rows, (32, 50, 32, 32, 32, oracledb.DB_TYPE_LONG, 64))
+                self._executemany_chunked(cursor, """
+                    INSERT INTO OUTREACH_LOGS (OLG_ID, ELG_ID, MESSAGE_TEXT, SENT_AT)
+                    VALUES (:1, :2, :3, TO_TIMESTAMP(:4, 'YYYY-MM-DD"T"HH24:MI:SS.FF6"Z"'))
+                """, outreach_rows, (32, 32, oracledb.DB_TYPE_LONG, 64))
+
                 connection.commit()
         return mapping
 
+    def _executemany_chunked(self, cursor, sql, rows, input_sizes):
+        """
+        executemany() in DML_BATCH_SIZE chunks with fixed bind sizes, so the
+        driver doesn't re-derive them from every row. Ints are VARCHAR2
+        lengths; DB_TYPE_LONG carries the CLOB columns.
+        """
+        for start in range(0, len(rows), self.DML_BATCH_SIZE):
+            cursor.setinputsizes(*input_sizes)
+            cursor.executemany(sql, rows[start:start + self.DML_BATCH_SIZE])
+
     def close(self):
         if self.pool:
             self.pool.close()
\ No newline at end of file
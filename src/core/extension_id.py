@@ -0,0 +1,17 @@
+"""
+Chrome extension ID derivation.
+
+Imported by: the setup wizard and scripts/generate_key*.py.
+"""
+
+import hashlib
+
+# Chrome extension IDs are the first 16 bytes of SHA-256(public key DER) in
+# hex with 0-f -> a-p; each digest byte maps straight to its two letters.
+_BYTE_TO_AP = [bytes((ord('a') + (b >> 4), ord('a') + (b & 0xF))) for b in range(256)]
+
+
+def extension_id(der_key: bytes) -> str:
+    """Return the 32-letter extension ID for a DER-encoded public key."""
+    digest16 = hashlib.sha256(der_key).digest()[:16]
+    return b''.join(_BYTE_TO_AP[b] for b in digest16).decode('ascii')
@@ -92,6 +92,9 @@ class IPCServer:
         self.running = False
         self._lock = threading.Lock()
         
+        # Shared across discovery runs so its HTTP connection pool is reused
+        self._discoverer = None
+        
         # Client management for broadcasting
         self.active_clients = {} # {client_id: {'socket': sock, 'lock': threading.Lock()}}
         self.clients_lock = threading.Lock() # Protects the active_clients dict itself
@@ -203,7 +206,9 @@ class IPCServer:
     def _run_background_discovery(self, profile_id, profile_data):
         """Runs the Contact Discovery module in a background thread."""
         try:
-            discoverer = ContactDiscoverer()
+            if self._discoverer is None:
+                self._discoverer = ContactDiscoverer()
+            discoverer = self._discoverer
             print(f"[Discovery] Starting background discovery for {profile_id}...")
             
             result = discoverer.process_profile(profile_data)
@@ -77,8 +77,7 @@ class SyncEngine:
         """
         try:
             print("[SyncEngine] Pulling Governance Data (Rules & Goals)...")
-            rules = self.db_manager.fetch_active_rules()
-            goals = self.db_manager.fetch_active_goals()
+            rules, goals = self.db_manager.fetch_governance_data()
             
             local_db.update_rules_cache(rules)
             local_db.update_goals_cache(goals)
@@ -137,15 +136,17 @@ class SyncEngine:
         local_db = None
         try:
             local_db = LocalDatabase()
-            
-            # 1. Heartbeat (High Priority)
-            self._send_heartbeat()
 
-            # 2. Pull Governance
-            self._pull_governance_data(local_db)
+            # One pooled Oracle connection for the whole cycle
+            with self.db_manager.session():
+                # 1. Heartbeat (High Priority)
+                self._send_heartbeat()
+
+                # 2. Pull Governance
+                self._pull_governance_data(local_db)
 
-            # 3. Push Events
-            self._push_local_events(local_db)
+                # 3. Push Events
+                self._push_local_events(local_db)
 
             # 4. Success Callback
             if self.on_update_callback:
@@ -34,17 +34,13 @@ def compare_versions(v1: str, v2: str) -> int:
     Compare two version strings.
     Returns: -1 if v1 < v2, 0 if v1 == v2, 1 if v1 > v2
     """
-    v1_parts = [int(x) for x in v1.lstrip('v').split('.')]
-    v2_parts = [int(x) for x in v2.lstrip('v').split('.')]
+    v1_parts = tuple(int(x) for x in v1.lstrip('v').split('.'))
+    v2_parts = tuple(int(x) for x in v2.lstrip('v').split('.'))
 
-    # Pad shorter version with zeros
+    # Pad shorter version with zeros so "1.0" == "1.0.0"
     max_len = max(len(v1_parts), len(v2_parts))
-    v1_parts.extend([0] * (max_len - len(v1_parts)))
-    v2_parts.extend([0] * (max_len - len(v2_parts)))
-
-    for a, b in zip(v1_parts, v2_parts):
-        if a < b:
-            return -1
-        elif a > b:
-            return 1
-    return 0
+    v1_parts += (0,) * (max_len - len(v1_parts))
+    v2_parts += (0,) * (max_len - len(v2_parts))
+
+    # Tuples compare lexicographically in C
+    return (v1_parts > v2_parts) - (v1_parts < v2_parts)
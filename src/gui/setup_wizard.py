@@ -42,8 +42,8 @@ import shutil
 from tkinter import messagebox, filedialog
 from src.core.security import get_zip_password
 from src.core.version import __app_name__
+from src.core.extension_id import extension_id
 import base64
-import hashlib
 try:
     from cryptography.hazmat.primitives.asymmetric import rsa
     from cryptography.hazmat.primitives import serialization
@@ -78,7 +78,6 @@ try:
 except ImportError:
     DND_AVAILABLE = False
 
-
 class HelpTooltip:
     """A tooltip popup that appears when hovering a help icon."""
     active_tooltip = None
@@ -239,6 +238,8 @@ class SetupWizard(CTkDnD):
 
         # --- PERMANENT ID GENERATION ---
         # Generate a key on startup to ensure ID is fixed
+        # (id_gen_done is set once the thread has finished, success or not)
+        self.id_gen_done = threading.Event()
         threading.Thread(target=self._generate_permanent_id, daemon=True).start()
 
     def _generate_permanent_id(self):
@@ -247,6 +248,7 @@ class SetupWizard(CTkDnD):
         manifest_path = os.path.join(project_root, 'src', 'extension', 'manifest.json')
         
         if os.path.exists(key_path):
+            self.id_gen_done.set()
             return # Already generated
             
         try:
@@ -284,9 +286,7 @@ class SetupWizard(CTkDnD):
                 json.dump(data, f, indent=4)
                 
             # Calculate Extension ID
-            sha = hashlib.sha256(der_key).hexdigest()
-            prefix = sha[:32]
-            ext_id = "".join([chr(ord('a') + int(char, 16)) for char in prefix])
+            ext_id = extension_id(der_key)
             
             print(f"[Setup] Generated permanent Extension Key.")
             print(f"[Setup] Extension ID: {ext_id}")
@@ -305,6 +305,7 @@ class SetupWizard(CTkDnD):
             
         except Exception as e:
             print(f"[Setup] Failed to generate ID: {e}")
+        self.id_gen_done.set()
 
     def _create_main_container(self):
         self.main_frame = ctk.CTkFrame(self, fg_color="transparent")
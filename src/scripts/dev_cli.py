@@ -171,7 +171,6 @@ a = Analysis(
         'tkinter',
         'sqlite3',
         '_sqlite3',
-        'pandas',
         'bs4',
         'requests',
         'PIL',
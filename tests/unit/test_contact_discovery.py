@@ -0,0 +1,90 @@
+"""
+Unit tests for contact discovery text helpers.
+"""
+
+import pytest
+
+pytest.importorskip('requests')
+pytest.importorskip('bs4')
+
+from src.core.contact_discovery import ContactDiscoverer
+
+
+@pytest.fixture(scope='module')
+def discoverer():
+    return ContactDiscoverer()
+
+
+class TestScanContacts:
+    """_scan_contacts must match the original separate EMAIL/PHONE searches."""
+
+    @staticmethod
+    def _reference(discoverer, text, email=None):
+        if not email:
+            email_match = discoverer.EMAIL_REGEX.search(text)
+            if email_match:
+                email = email_match.group(0)
+        phone_raw = discoverer.PHONE_REGEX.search(text)
+        phone = discoverer._validate_phone(phone_raw.group(0)) if phone_raw else None
+        return email, phone
+
+    @pytest.mark.parametrize('text', [
+        '',
+        'no contact details here',
+        'Email me at hello@example.com',
+        'Call (212) 555-1234 today',
+        'hello@example.com or +1 212.555.1234',
+        '2125551234@mail.com',
+        'Call 212-555-1234 or mail 3105550000@example.org',
+        'old 123-456-7890 then 415 555 0000',
+        'a@b.c x@y.io 646-555-9876',
+    ])
+    def test_matches_separate_searches(self, discoverer, text):
+        assert discoverer._scan_contacts(text) == self._reference(discoverer, text)
+
+    def test_known_email_is_kept(self, discoverer):
+        text = 'other@example.com 212-555-1234'
+        assert discoverer._scan_contacts(text, 'mailto@example.com') == \
+            ('mailto@example.com', '(212) 555-1234')
+
+    def test_phone_inside_email_local_part(self, discoverer):
+        assert discoverer._scan_contacts('2125551234@mail.com') == \
+            ('2125551234@mail.com', '(212) 555-1234')
+
+
+class TestCleanInstagramUrl:
+    """_clean_instagram_url must match the original urlparse/parse_qs decoding."""
+
+    @staticmethod
+    def _reference(url):
+        from urllib.parse import unquote, urlparse, parse_qs
+        if not url: return url
+        if 'l.instagram.com' in url:
+            try:
+                parsed = urlparse(url)
+                qs = parse_qs(parsed.query)
+                if 'u' in qs:
+                    return unquote(qs['u'][0])
+            except Exception:
+                pass
+        return url
+
+    @pytest.mark.parametrize('url', [
+        '',
+        None,
+        'https://example.com/?u=https%3A%2F%2Fother.com',
+        'https://l.instagram.com/',
+        'https://l.instagram.com/?u=https%3A%2F%2Fexample.com%2Fpage&e=AT0',
+        'https://l.instagram.com/?e=AT0&u=https%3A%2F%2Fexample.com',
+        'https://l.instagram.com/?u=https%253A%252F%252Fexample.com',
+        'https://l.instagram.com/?u=https%3A%2F%2Fexample.com%2F%3Fq%3Da%2Bb',
+        'https://l.instagram.com/?u=a+b',
+        'https://l.instagram.com/?u=&e=1',
+        'https://l.instagram.com/?uu=x&u=y',
+        'https://l.instagram.com/?u=first&u=second',
+        'https://l.instagram.com/path#?u=frag',
+        'https://l.instagram.com/?e=1#&u=frag',
+        'https://l.instagram.com/?u=https%3A%2F%2Fexample.com#section',
+    ])
+    def test_matches_parse_qs(self, discoverer, url):
+        assert discoverer._clean_instagram_url(url) == self._reference(url)
@@ -0,0 +1,83 @@
+"""
+Unit tests for DatabaseManager logic that doesn't need a live Oracle instance.
+"""
+
+from unittest import mock
+
+import pytest
+
+pytest.importorskip('oracledb')
+pytest.importorskip('dotenv')
+
+from src.core import database
+
+
+@pytest.fixture
+def cursor():
+    return mock.MagicMock()
+
+
+@pytest.fixture
+def db(monkeypatch, cursor):
+    """DatabaseManager over a fake pool whose connections share one cursor."""
+    connection = mock.MagicMock()
+    connection.__enter__.return_value = connection
+    connection.cursor.return_value.__enter__.return_value = cursor
+    pool = mock.MagicMock()
+    pool.acquire.return_value = connection
+    monkeypatch.setattr(database, 'HAS_CONFIG', True)
+    monkeypatch.setattr(database.oracledb, 'create_pool', lambda **kwargs: pool)
+    return database.DatabaseManager()
+
+
+class TestEnsureActorExists:
+    """The known-actor cache must only hold pairs that are really in ACTORS."""
+
+    @staticmethod
+    def _merges(cursor):
+        return [c for c in cursor.execute.call_args_list if 'MERGE' in c.args[0]]
+
+    def test_missing_operator_is_not_cached(self, db, cursor):
+        cursor.fetchone.return_value = None   # Lookup finds no operator
+
+        db.ensure_actor_exists('actor', 'ghost_operator')
+        db.ensure_actor_exists('actor', 'ghost_operator')
+
+        assert cursor.execute.call_count == 2  # Looked up again, never merged
+        assert not self._merges(cursor)
+        assert ('actor', 'ghost_operator') not in db._known_actors
+
+    def test_missing_operator_is_reported(self, db, cursor, capsys):
+        cursor.fetchone.return_value = None
+        db.ensure_actor_exists('actor', 'ghost_operator')
+        assert "Operator 'ghost_operator' not found" in capsys.readouterr().out
+
+    def test_registered_after_operator_appears(self, db, cursor):
+        cursor.fetchone.return_value = None
+        db.ensure_actor_exists('actor', 'late_operator')
+
+        cursor.fetchone.return_value = ('OPR-1', 0)  # Operator now exists, pair doesn't
+        cursor.rowcount = 1
+        db.ensure_actor_exists('actor', 'late_operator')
+
+        assert len(self._merges(cursor)) == 1
+        assert ('actor', 'late_operator') in db._known_actors
+
+    def test_existing_pair_is_one_round_trip(self, db, cursor):
+        cursor.fetchone.return_value = ('OPR-1', 1)
+
+        db.ensure_actor_exists('actor', 'operator')
+        assert cursor.execute.call_count == 1
+        assert not self._merges(cursor)
+
+        db.ensure_actor_exists('actor', 'operator')  # Cached: no DB work
+        assert cursor.execute.call_count == 1
+        assert ('actor', 'operator') in db._known_actors
+
+    def test_act_id_keeps_documented_format(self, db, cursor):
+        cursor.fetchone.return_value = ('OPR-1', 0)
+        cursor.rowcount = 1
+        db.ensure_actor_exists('actor', 'operator')
+        act_id, username, opr_id = self._merges(cursor)[0].args[1]
+        assert act_id.startswith('ACT-') and len(act_id) == 12
+        assert (username, opr_id) == ('actor', 'OPR-1')
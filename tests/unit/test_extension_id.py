@@ -0,0 +1,33 @@
+"""
+Unit tests for Chrome extension ID derivation.
+"""
+
+import hashlib
+
+import pytest
+
+from src.core.extension_id import extension_id
+
+
+def _reference_extension_id(der_key):
+    """The original hexdigest -> a-p algorithm."""
+    prefix = hashlib.sha256(der_key).hexdigest()[:32]
+    return "".join(chr(ord('a') + int(char, 16)) for char in prefix)
+
+
+class TestExtensionId:
+    """Tests for extension_id()."""
+
+    @pytest.mark.parametrize('der_key', [
+        b'',
+        b'\x00' * 294,
+        bytes(range(256)),
+        b'0\x82\x01"0\r\x06\t*\x86H\x86\xf7\r\x01\x01\x01\x05\x00',
+    ])
+    def test_matches_hexdigest_algorithm(self, der_key):
+        assert extension_id(der_key) == _reference_extension_id(der_key)
+
+    def test_shape(self):
+        ext_id = extension_id(b'some public key')
+        assert len(ext_id) == 32
+        assert set(ext_id) <= set('abcdefghijklmnop')
@@ -0,0 +1,61 @@
+"""
+Unit tests for version comparison.
+"""
+
+import importlib
+import sys
+
+import pytest
+
+from src.core.version import compare_versions
+
+
+class TestCompareVersions:
+    """Tests for semantic version comparison."""
+
+    def test_equal_versions(self):
+        assert compare_versions('1.2.3', '1.2.3') == 0
+
+    def test_leading_v_is_ignored(self):
+        assert compare_versions('v1.2.3', '1.2.3') == 0
+
+    def test_older_and_newer(self):
+        assert compare_versions('1.2.3', '1.3.0') == -1
+        assert compare_versions('2.0.0', '1.9.9') == 1
+
+    def test_numeric_not_lexicographic(self):
+        assert compare_versions('1.2.0', '1.10.0') == -1
+
+    def test_missing_parts_are_zero_padded(self):
+        assert compare_versions('1.0', '1.0.0') == 0
+        assert compare_versions('1.0', '1.0.1') == -1
+
+
+class TestLauncherFallbackCompareVersions:
+    """The launcher's fallback (used when src.core.version can't be imported) must agree."""
+
+    @pytest.fixture
+    def fallback_compare(self, monkeypatch):
+        # launcher inserts src/ and src/core/ into sys.path on import; roll that back
+        monkeypatch.setattr(sys, 'path', list(sys.path))
+        monkeypatch.setitem(sys.modules, 'src.core.version', None)
+        monkeypatch.delitem(sys.modules, 'launcher', raising=False)
+        launcher = importlib.import_module('launcher')
+        yield launcher.compare_versions
+        sys.modules.pop('launcher', None)
+
+    def test_uses_fallback(self, fallback_compare):
+        assert fallback_compare is not compare_versions
+
+    @pytest.mark.parametrize('v1, v2', [
+        ('1.2.3', '1.2.3'),
+        ('v1.2.3', '1.2.3'),
+        ('1.2.3', '1.3.0'),
+        ('2.0.0', '1.9.9'),
+        ('1.2.0', '1.10.0'),
+        ('1.0', '1.0.0'),
+        ('1.0', '1.0.1'),
+        ('1.0.0', '1.0'),
+    ])
+    def test_matches_canonical(self, fallback_compare, v1, v2):
+        assert fallback_compare(v1, v2) == compare_versions(v1, v2)